@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from launch_webhook_aws.bitbucket_server.type import (
     Change,
@@ -11,7 +11,7 @@ from launch_webhook_aws.bitbucket_server.type import (
     Repository,
     User,
 )
-from launch_webhook_aws.event import ScmEvent, ScmHeaders
+from launch_webhook_aws.event import REQUEST_ID_HEADER, ScmEvent, ScmHeaders
 
 
 class EventType(StrEnum):
@@ -22,7 +22,7 @@ class EventType(StrEnum):
 
 
 class BitbucketServerHeaders(ScmHeaders):
-    x_request_id: str = Field(alias="X-Request-Id")
+    x_request_id: str = Field(alias=REQUEST_ID_HEADER)
     x_event_key: str = Field(alias="X-Event-Key")
     # Bitbucket Server only provides a signature when a webhook is configured with a secret
     x_hub_signature: str = Field(default="", alias="X-Hub-Signature")
@@ -38,9 +38,17 @@ class BitbucketServerEvent(ScmEvent):
         # Bitbucket Server provides SHA256 signatures as "X-Hub-Signature"
         return self.headers.x_hub_signature
 
+    @property
+    def action_type(self) -> str:
+        return self.event_key
+
+    @property
+    def owner_name(self) -> str:
+        return self.project_key
+
 
 class Push(BitbucketServerEvent):
-    event_key: Literal[EventType.REPO_REFS_CHANGED] = Field(alias="eventKey")
+    event_key: Literal["repo:refs_changed"] = Field(alias="eventKey")
     repository: Repository
     changes: list[Change]
 
@@ -53,10 +61,8 @@ class Push(BitbucketServerEvent):
         return self.repository.name
 
 
-class SourceBranchUpdated(BitbucketServerEvent):
-    event_key: Literal[EventType.PR_FROM_REF_UPDATED] = Field(alias="eventKey")
+class PullRequestEvent(BitbucketServerEvent):
     pull_request: PullRequest = Field(alias="pullRequest")
-    previous_from_hash: CommitHash = Field(alias="previousFromHash")
 
     @property
     def project_key(self) -> str:
@@ -67,30 +73,17 @@ class SourceBranchUpdated(BitbucketServerEvent):
         return self.pull_request.to_ref.repository.name
 
 
-class PullRequestOpened(BitbucketServerEvent):
-    event_key: Literal[EventType.PR_OPENED] = Field(alias="eventKey")
-    pull_request: PullRequest = Field(alias="pullRequest")
-
-    @property
-    def project_key(self) -> str:
-        return self.pull_request.to_ref.repository.project.key
-
-    @property
-    def repository_name(self) -> str:
-        return self.pull_request.to_ref.repository.name
+class SourceBranchUpdated(PullRequestEvent):
+    event_key: Literal["pr:from_ref_updated"] = Field(alias="eventKey")
+    previous_from_hash: CommitHash = Field(alias="previousFromHash")
 
 
-class PullRequestMerged(BitbucketServerEvent):
-    event_key: Literal[EventType.PR_MERGED] = Field(alias="eventKey")
-    pull_request: PullRequest = Field(alias="pullRequest")
+class PullRequestOpened(PullRequestEvent):
+    event_key: Literal["pr:opened"] = Field(alias="eventKey")
 
-    @property
-    def project_key(self) -> str:
-        return self.pull_request.to_ref.repository.project.key
 
-    @property
-    def repository_name(self) -> str:
-        return self.pull_request.to_ref.repository.name
+class PullRequestMerged(PullRequestEvent):
+    event_key: Literal["pr:merged"] = Field(alias="eventKey")
 
 
 BitbucketServerEventType = Annotated[
@@ -102,3 +95,6 @@ BitbucketServerEventType = Annotated[
 class BitbucketServerWebhookEvent(BaseModel):
     headers: BitbucketServerHeaders
     event: BitbucketServerEventType
+
+
+BitbucketServerEventAdapter = TypeAdapter(BitbucketServerEventType)
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from launch_webhook_aws.type import CommitHash, HttpsUrl, SshUrl
 
@@ -47,26 +47,32 @@ class ApprovalStatus(StrEnum):
     UNAPPROVED = "UNAPPROVED"
 
 
-class SshLink(BaseModel):
+class PayloadModel(BaseModel):
+    # Payload types are validated as part of the event that contains them, so
+    # building their standalone validators is deferred until first direct use.
+    model_config = ConfigDict(defer_build=True)
+
+
+class SshLink(PayloadModel):
     href: SshUrl
     name: Literal["ssh"]
 
 
-class HttpLink(BaseModel):
+class HttpLink(PayloadModel):
     href: HttpsUrl
     name: Literal["http"]
 
 
-class BareLink(BaseModel):
+class BareLink(PayloadModel):
     href: HttpsUrl
 
 
-class Links(BaseModel):
+class Links(PayloadModel):
     clone: list[HttpLink | SshLink] | None = Field(default=None)
     self: list[BareLink]
 
 
-class Project(BaseModel):
+class Project(PayloadModel):
     key: str
     id: int
     name: str
@@ -75,13 +81,13 @@ class Project(BaseModel):
     links: Links
 
 
-class RefInfo(BaseModel):
+class RefInfo(PayloadModel):
     id: str
     display_id: str = Field(alias="displayId")
     type: RefType
 
 
-class Change(BaseModel):
+class Change(PayloadModel):
     ref: RefInfo
     ref_id: str = Field(alias="refId")
     from_hash: CommitHash = Field(alias="fromHash")
@@ -89,7 +95,7 @@ class Change(BaseModel):
     type: ChangeType
 
 
-class Repository(BaseModel):
+class Repository(PayloadModel):
     slug: str
     id: int
     name: str
@@ -103,9 +109,9 @@ class Repository(BaseModel):
     links: Links
 
 
-class User(BaseModel):
+class User(PayloadModel):
     name: str
-    email_address: EmailStr = Field(alias="emailAddress")
+    email_address: str = Field(alias="emailAddress")
     active: bool
     display_name: str = Field(alias="displayName")
     id: int
@@ -114,7 +120,7 @@ class User(BaseModel):
     links: Links
 
 
-class Participant(BaseModel):
+class Participant(PayloadModel):
     user: User
     role: ParticipantRole
     approved: bool
@@ -122,14 +128,11 @@ class Participant(BaseModel):
 
 
 class Ref(RefInfo):
-    id: str
-    display_id: str = Field(alias="displayId")
     latest_commit: CommitHash = Field(alias="latestCommit")
-    type: RefType
     repository: Repository
 
 
-class PullRequest(BaseModel):
+class PullRequest(PayloadModel):
     id: int
     version: int
     title: str
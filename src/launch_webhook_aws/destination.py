@@ -1,11 +1,15 @@
-import json
 import logging
 import os
+import time
 from abc import abstractmethod
-from typing import Annotated, Literal, TypeAlias, Union
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Literal, TypeAlias, Union
 
 import boto3
-from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic_core import to_json
 from types_boto3_codebuild import Client as CodeBuildClient
 from types_boto3_codepipeline import Client as CodePipelineClient
 from types_boto3_lambda import Client as LambdaClient
@@ -16,21 +20,67 @@ from .transform import CodeBuildVariable
 ASSUMED_ROLE_SESSION_DURATION_SECONDS = int(
     os.environ.get("ASSUMED_ROLE_SESSION_DURATION_SECONDS", 900)
 )
+ASSUMED_ROLE_REFRESH_MARGIN_SECONDS = 60
+CLIENT_CACHE_SIZE = int(os.environ.get("CLIENT_CACHE_SIZE", "32"))
+NO_OVERRIDES = MappingProxyType({})
+
+
+@cache
+def default_sts_client() -> StsClient:
+    return boto3.client("sts")
+
+
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def build_client(
+    client_type: str,
+    region: str | None,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    aws_session_token: str,
+) -> Any:
+    """Builds a boto3 client, reusing a previously built one for the same credentials.
+
+    Client construction loads and resolves the service model, which is far more
+    expensive than the API call we make with it, so clients are cached per set of
+    assumed role credentials and reused until those credentials rotate out.
+    """
+    region_kwargs = {"region_name": region} if region else {}
+    return boto3.client(
+        client_type,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_session_token=aws_session_token,
+        **region_kwargs,
+    )
 
 
-class AssumedRoleCredentials(BaseModel):
-    aws_access_key_id: SecretStr = Field(alias="AccessKeyId")
-    aws_secret_access_key: SecretStr = Field(alias="SecretAccessKey")
-    aws_session_token: SecretStr = Field(alias="SessionToken")
+@dataclass(frozen=True, slots=True)
+class AssumedRoleCredentials:
+    aws_access_key_id: str = field(repr=False)
+    aws_secret_access_key: str = field(repr=False)
+    aws_session_token: str = field(repr=False)
+
+    @classmethod
+    def from_response(cls, credentials: dict[str, Any]) -> "AssumedRoleCredentials":
+        return cls(
+            aws_access_key_id=credentials["AccessKeyId"],
+            aws_secret_access_key=credentials["SecretAccessKey"],
+            aws_session_token=credentials["SessionToken"],
+        )
+
+
+# Credentials from an assumed role are shared by every destination assuming it
+# with the same parameters, keyed on (role_arn, external_id, session_name) and
+# stored alongside the monotonic time at which they expire.
+_assumed_role_cache: dict[
+    tuple[str, str | None, str], tuple[float, AssumedRoleCredentials]
+] = {}
 
-    @field_serializer(
-        "aws_access_key_id",
-        "aws_secret_access_key",
-        "aws_session_token",
-        when_used="always",
-    )
-    def serialize_secret(self, value: SecretStr) -> str:
-        return value.get_secret_value()
+
+def clear_caches() -> None:
+    """Forgets all cached assumed role credentials and clients."""
+    _assumed_role_cache.clear()
+    build_client.cache_clear()
 
 
 class Destination(BaseModel):
@@ -52,34 +102,59 @@ class AwsDestination(Destination):
     external_id: str | None = Field(default=None)
     region: str | None = Field(default=None)
     session_name: str = Field(default=os.getenv("SESSION_NAME", "launch_webhook_aws"))
-    sts_client: StsClient = Field(default_factory=lambda: boto3.client("sts"))
+    sts_client: StsClient = Field(default_factory=default_sts_client)
     logger: logging.Logger = Field(
         default_factory=lambda: logging.getLogger("destination")
     )
+    # The assumed role credentials the current client was built with, so the
+    # client is rebuilt once those credentials are refreshed.
+    _client_credentials: AssumedRoleCredentials | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
+    def assumed_role_credentials(self) -> AssumedRoleCredentials:
+        cache_key = (self.role_arn, self.external_id, self.session_name)
+        cached = _assumed_role_cache.get(cache_key)
+        now = time.monotonic()
+        if cached and now < cached[0] - ASSUMED_ROLE_REFRESH_MARGIN_SECONDS:
+            return cached[1]
+
+        external_id = {"ExternalId": self.external_id} if self.external_id else {}
+        assumed_role = self.sts_client.assume_role(
+            RoleArn=self.role_arn,
+            RoleSessionName=self.session_name,
+            DurationSeconds=ASSUMED_ROLE_SESSION_DURATION_SECONDS,
+            **external_id,
+        )
+        creds = AssumedRoleCredentials.from_response(assumed_role["Credentials"])
+        _assumed_role_cache[cache_key] = (
+            now + ASSUMED_ROLE_SESSION_DURATION_SECONDS,
+            creds,
+        )
+        return creds
+
     def assume_role(self) -> None:
-        if not getattr(self, "client"):
-            external_id = {"ExternalId": self.external_id} if self.external_id else {}
-            assumed_role = self.sts_client.assume_role(
-                RoleArn=self.role_arn,
-                RoleSessionName=self.session_name,
-                DurationSeconds=ASSUMED_ROLE_SESSION_DURATION_SECONDS,
-                **external_id,
-            )
-            creds = AssumedRoleCredentials(**assumed_role["Credentials"])
-            client_type = self.type
-            if client_type == "lambdafunction":
-                client_type = "lambda"
-
-            if self.region:
-                self.client = boto3.client(
-                    client_type, region_name=self.region, **creds.model_dump()
-                )
-            else:
-                self.client = boto3.client(client_type, **creds.model_dump())
-            self.logger.debug(f"Assumed role {self.role_arn}")
+        if self.client is not None and self._client_credentials is None:
+            # A client supplied by the caller is used as-is.
+            return
+
+        creds = self.assumed_role_credentials()
+        if creds is self._client_credentials:
+            return
+
+        client_type = self.type
+        if client_type == "lambdafunction":
+            client_type = "lambda"
+
+        self.client = build_client(
+            client_type,
+            self.region,
+            creds.aws_access_key_id,
+            creds.aws_secret_access_key,
+            creds.aws_session_token,
+        )
+        self._client_credentials = creds
+        self.logger.debug(f"Assumed role {self.role_arn}")
 
 
 class CodeBuild(AwsDestination):
@@ -93,10 +168,9 @@ class CodeBuild(AwsDestination):
     def invoke(self, transformed_event: dict[str, str]) -> None:
         self.assume_role()
 
-        project_name = transformed_event.get(self.type, {}).get(
-            "project_name", self.project_name
-        )
-        environment_variables_override = transformed_event.get(self.type, {}).get(
+        overrides = transformed_event.get(self.type) or NO_OVERRIDES
+        project_name = overrides.get("project_name", self.project_name)
+        environment_variables_override = overrides.get(
             "environment_variables_override", self.environment_variables_override
         )
 
@@ -115,12 +189,9 @@ class CodePipeline(AwsDestination):
     def invoke(self, transformed_event: dict[str, str]) -> None:
         self.assume_role()
 
-        pipeline_name = transformed_event.get(self.type, {}).get(
-            "pipeline_name", self.pipeline_name
-        )
-        variables = transformed_event.get(self.type, {}).get(
-            "variables", self.variables
-        )
+        overrides = transformed_event.get(self.type) or NO_OVERRIDES
+        pipeline_name = overrides.get("pipeline_name", self.pipeline_name)
+        variables = overrides.get("variables", self.variables)
         if len(variables):
             self.client.start_pipeline_execution(
                 name=pipeline_name, variables=variables
@@ -129,6 +200,19 @@ class CodePipeline(AwsDestination):
             self.client.start_pipeline_execution(name=pipeline_name)
 
 
+def encode_json_payload(payload: list | dict) -> bytes:
+    return to_json(payload)
+
+
+LAMBDA_PAYLOAD_ENCODERS: dict[type, Callable[[Any], bytes]] = {
+    dict: encode_json_payload,
+    str: str.encode,
+    bytes: bytes,
+    list: encode_json_payload,
+    type(None): lambda _: b"",
+}
+
+
 class LambdaFunction(AwsDestination):
     type: Literal["lambdafunction"]
     function_name: str
@@ -137,24 +221,26 @@ class LambdaFunction(AwsDestination):
 
     @staticmethod
     def convert_lambda_payload(payload: None | bytes | str | list | dict) -> bytes:
-        if payload is None:
-            return b""
-        elif isinstance(payload, bytes):
-            return payload
-        elif isinstance(payload, str):
-            return payload.encode("utf-8")
-        elif isinstance(payload, list) or isinstance(payload, dict):
-            return json.dumps(payload).encode("utf-8")
-        raise ValueError(f"Unsupported type for Lambda payload: {type(payload)}")
+        encoder = LAMBDA_PAYLOAD_ENCODERS.get(type(payload))
+        if encoder is None:
+            # Subclasses of the supported types miss the exact-type lookup.
+            for payload_type, payload_encoder in LAMBDA_PAYLOAD_ENCODERS.items():
+                if isinstance(payload, payload_type):
+                    encoder = payload_encoder
+                    break
+            else:
+                raise ValueError(
+                    f"Unsupported type for Lambda payload: {type(payload)}"
+                )
+        return encoder(payload)
 
     def invoke(self, transformed_event: dict[str, str]) -> None:
         self.assume_role()
 
-        function_name = transformed_event.get(self.type, {}).get(
-            "function_name", self.function_name
-        )
+        overrides = transformed_event.get(self.type) or NO_OVERRIDES
+        function_name = overrides.get("function_name", self.function_name)
         payload = LambdaFunction.convert_lambda_payload(
-            payload=transformed_event.get(self.type, {}).get("payload", self.payload)
+            payload=overrides.get("payload", self.payload)
         )
 
         self.client.invoke(FunctionName=function_name, Payload=payload)
@@ -19,12 +19,26 @@ class ScmEvent(BaseModel):
     @abstractmethod
     def repository_name(self) -> str | None: ...
 
+    @property
+    @abstractmethod
+    def action_type(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def owner_name(self) -> str: ...
+
+
+# Header names are module constants so every lookup reuses the same interned
+# string and its cached hash.
+GITHUB_HOOK_ID_HEADER = "X-Github-Hook-Id"
+HOOK_UUID_HEADER = "X-Hook-UUID"
+REQUEST_ID_HEADER = "X-Request-Id"
 
 def discriminate_headers(v: Any) -> str:
-    if "X-Github-Hook-Id" in v:
+    if GITHUB_HOOK_ID_HEADER in v:
         return "github"
-    if "X-Request-Id" in v:
-        if "X-Hook-UUID" in v:
+    if REQUEST_ID_HEADER in v:
+        if HOOK_UUID_HEADER in v:
             return "bitbucket_cloud"
         return "bitbucket_server"
     raise ValueError("Failed to discriminate header source")
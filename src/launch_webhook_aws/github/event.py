@@ -1,10 +1,9 @@
-import warnings
 from enum import StrEnum
-from typing import Annotated, Literal, Union
+from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
 
-from launch_webhook_aws.event import ScmEvent, ScmHeaders
+from launch_webhook_aws.event import GITHUB_HOOK_ID_HEADER, ScmEvent, ScmHeaders
 from launch_webhook_aws.github.type import (
     Hook,
     PullRequest,
@@ -14,11 +13,6 @@ from launch_webhook_aws.github.type import (
 )
 from launch_webhook_aws.type import CommitHash, HttpsUrl
 
-# Pydantic raises warnings when we shadow the header_event from GithubEvent
-# on the subclasses, but this isn't useful information so we can filter them
-# out.
-warnings.filterwarnings("ignore", category=UserWarning, module="pydantic", lineno=192)
-
 
 class EventType(StrEnum):
     # Some actions only contain an X-Github-Event header,
@@ -34,26 +28,26 @@ class EventType(StrEnum):
 
 
 class GithubHeaders(ScmHeaders):
-    x_github_hook_id: str = Field(alias="X-Github-Hook-Id")
+    x_github_hook_id: str = Field(alias=GITHUB_HOOK_ID_HEADER)
     x_github_event: str = Field(alias="X-Github-Event")
     x_github_delivery: str = Field(alias="X-Github-Delivery")
     x_hub_signature: str = Field(alias="X-Hub-Signature")
     x_hub_signature_256: str = Field(alias="X-Hub-Signature-256")
 
-    model_config = ConfigDict(extra="allow")
+    # Only the headers modelled above are kept; API gateways forward many more.
+    model_config = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
 
 
 class GithubEvent(ScmEvent):
     headers: GithubHeaders
+    # Mirrors the X-Github-Event header; subclasses narrow this to the literal
+    # event name so it can serve as the discriminator.
+    header_event: str
 
     @property
     def signature_hash_sha256(self) -> str:
         return self.headers.x_hub_signature_256
 
-    @property
-    def header_event(self) -> str:
-        return self.headers.x_github_event
-
     @property
     def organization_name(self) -> str:
         return getattr(getattr(self, "repository"), "full_name").split("/")[0]
@@ -69,9 +63,13 @@ class GithubEvent(ScmEvent):
     def repository_name(self) -> str:
         return self.repository.name
 
+    @property
+    def owner_name(self) -> str:
+        return self.organization_name
+
 
 class Ping(GithubEvent):
-    header_event: Literal[EventType.PING]
+    header_event: Literal["ping"] = "ping"
     zen: str
     hook_id: int
     hook: Hook
@@ -80,17 +78,19 @@ class Ping(GithubEvent):
 
 
 class Push(GithubEvent):
-    header_event: Literal[EventType.PUSH]
+    header_event: Literal["push"] = "push"
 
     after: CommitHash
     base_ref: None
     before: CommitHash
-    commits: list
+    # Pushes can carry hundreds of commits that few transforms read, so the
+    # commit payloads are passed through as-is rather than validated.
+    commits: SkipValidation[list]
     compare: HttpsUrl
     created: bool
     deleted: bool
     forced: bool
-    head_commit: dict
+    head_commit: SkipValidation[dict | None]
     pusher: UserMetadata
     ref: str
     repository: Repository
@@ -98,7 +98,7 @@ class Push(GithubEvent):
 
 
 class PullRequestEvent(GithubEvent):
-    header_event: Literal["pull_request"]
+    header_event: Literal["pull_request"] = "pull_request"
     number: int
     pull_request: PullRequest
     repository: Repository
@@ -133,3 +133,28 @@ GithubEventType = Annotated[
 class GithubWebhookEvent(BaseModel):
     headers: GithubHeaders
     event: GithubEventType
+
+
+GithubEventAdapter = TypeAdapter(GithubEventType)
+
+# Github identifies the event in the X-Github-Event header rather than the
+# payload, so the header and the payload's action select the model up front
+# and only the matching payload shape is validated. Unrecognized events fall
+# back to the full union so they fail validation exactly as they would have
+# otherwise.
+EVENT_MODELS: dict[tuple[str, str | None], type[GithubEvent]] = {
+    ("ping", None): Ping,
+    ("push", None): Push,
+    ("pull_request", "opened"): PullRequestOpened,
+    ("pull_request", "closed"): PullRequestClosed,
+    ("pull_request", "synchronize"): PullRequestSynchronize,
+}
+
+
+def parse_github_event(headers: GithubHeaders, body: dict[str, Any]) -> GithubEvent:
+    header_event = headers.x_github_event
+    event = dict(body, headers=headers, header_event=header_event)
+    model = EVENT_MODELS.get((header_event, body.get("action")))
+    if model is None:
+        return GithubEventAdapter.validate_python(event)
+    return model.model_validate(event)
@@ -2,9 +2,9 @@ from datetime import datetime
 from enum import StrEnum
 from typing import ForwardRef, Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from launch_webhook_aws.type import CommitHash, GitUrl, HttpsUrl
+from launch_webhook_aws.type import ApiUrl, CommitHash, GitUrl, HttpsUrl
 
 
 class AuthorAssociation(StrEnum):
@@ -117,11 +117,22 @@ class HookType(StrEnum):
     APP = "App"
 
 
-class Link(BaseModel):
-    href: HttpsUrl
+class PayloadModel(BaseModel):
+    # Payload types are validated as part of the event that contains them, so
+    # building their standalone validators is deferred until first direct use.
+    model_config = ConfigDict(defer_build=True)
 
 
-class Links(BaseModel):
+class FrozenPayloadModel(PayloadModel):
+    # Payload types that are read-only once parsed.
+    model_config = ConfigDict(frozen=True)
+
+
+class Link(PayloadModel):
+    href: ApiUrl
+
+
+class Links(PayloadModel):
     comments: Link
     commits: Link
     html: Link
@@ -132,42 +143,42 @@ class Links(BaseModel):
     statuses: Link
 
 
-class Reactions(BaseModel):
+class Reactions(PayloadModel):
     plusone: int = Field(default=0, alias="+1")
     minusone: int = Field(default=0, alias="-1")
-    laugh: int = Field(default=0)
-    hooray: int = Field(default=0)
-    confused: int = Field(default=0)
-    heart: int = Field(default=0)
-    rocket: int = Field(default=0)
-    eyes: int = Field(default=0)
-    total_count: int = Field(default=0)
-    url: HttpsUrl
-
-
-class User(BaseModel):
-    avatar_url: HttpsUrl
-    events_url: HttpsUrl
-    deleted: bool | None = Field(default=False)
-    followers_url: HttpsUrl
-    following_url: HttpsUrl
-    gists_url: HttpsUrl
+    laugh: int = 0
+    hooray: int = 0
+    confused: int = 0
+    heart: int = 0
+    rocket: int = 0
+    eyes: int = 0
+    total_count: int = 0
+    url: ApiUrl
+
+
+class User(FrozenPayloadModel):
+    avatar_url: ApiUrl
+    events_url: ApiUrl
+    deleted: bool | None = False
+    followers_url: ApiUrl
+    following_url: ApiUrl
+    gists_url: ApiUrl
     gravatar_id: str
     html_url: HttpsUrl
     id: int
     login: str
     node_id: str
-    organizations_url: HttpsUrl
-    received_events_url: HttpsUrl
-    repos_url: HttpsUrl
+    organizations_url: ApiUrl
+    received_events_url: ApiUrl
+    repos_url: ApiUrl
     site_admin: bool
-    starred_url: HttpsUrl
-    subscriptions_url: HttpsUrl
+    starred_url: ApiUrl
+    subscriptions_url: ApiUrl
     type: UserType
-    url: HttpsUrl
+    url: ApiUrl
 
 
-class RepositoryMetadata(BaseModel):
+class RepositoryMetadata(PayloadModel):
     full_name: str
     id: int
     name: str
@@ -175,35 +186,35 @@ class RepositoryMetadata(BaseModel):
     private: bool
 
 
-class Repository(BaseModel):
-    archive_url: HttpsUrl
+class Repository(FrozenPayloadModel):
+    archive_url: ApiUrl
     archived: bool
-    assignees_url: HttpsUrl
-    blobs_url: HttpsUrl
-    branches_url: HttpsUrl
+    assignees_url: ApiUrl
+    blobs_url: ApiUrl
+    branches_url: ApiUrl
     clone_url: HttpsUrl
-    collaborators_url: HttpsUrl
-    comments_url: HttpsUrl
-    commits_url: HttpsUrl
-    compare_url: HttpsUrl
-    contents_url: HttpsUrl
-    contributors_url: HttpsUrl
+    collaborators_url: ApiUrl
+    comments_url: ApiUrl
+    commits_url: ApiUrl
+    compare_url: ApiUrl
+    contents_url: ApiUrl
+    contributors_url: ApiUrl
     created_at: datetime
     default_branch: str
-    delete_branch_on_merge: bool = Field(default=False)
-    deployments_url: HttpsUrl
-    description: str | None = Field(default=None)
+    delete_branch_on_merge: bool = False
+    deployments_url: ApiUrl
+    description: str | None = None
     disabled: bool
-    downloads_url: HttpsUrl
-    events_url: HttpsUrl
+    downloads_url: ApiUrl
+    events_url: ApiUrl
     fork: bool
     forks: int
     forks_count: int
-    forks_url: HttpsUrl
+    forks_url: ApiUrl
     full_name: str
-    git_commits_url: HttpsUrl
-    git_refs_url: HttpsUrl
-    git_tags_url: HttpsUrl
+    git_commits_url: ApiUrl
+    git_refs_url: ApiUrl
+    git_tags_url: ApiUrl
     git_url: GitUrl
     has_discussions: bool
     has_downloads: bool
@@ -211,58 +222,58 @@ class Repository(BaseModel):
     has_pages: bool
     has_projects: bool
     has_wiki: bool
-    homepage: str | None = Field(default=None)
-    hooks_url: HttpsUrl
+    homepage: str | None = None
+    hooks_url: ApiUrl
     html_url: HttpsUrl
     id: int
     is_template: bool
-    issue_comment_url: HttpsUrl
-    issue_events_url: HttpsUrl
-    issues_url: HttpsUrl
-    keys_url: HttpsUrl
-    labels_url: HttpsUrl
-    language: str | None = Field(default=None)
-    languages_url: HttpsUrl
-    license: dict | None = Field(default=None)
-    merge_commit_message: MergeCommitMessage | None = Field(default=None)
-    merge_commit_title: MergeCommitTitle | None = Field(default=None)
-    merges_url: HttpsUrl
-    milestones_url: HttpsUrl
-    mirror_url: HttpsUrl | None = Field(default=None)
+    issue_comment_url: ApiUrl
+    issue_events_url: ApiUrl
+    issues_url: ApiUrl
+    keys_url: ApiUrl
+    labels_url: ApiUrl
+    language: str | None = None
+    languages_url: ApiUrl
+    license: dict | None = None
+    merge_commit_message: MergeCommitMessage | None = None
+    merge_commit_title: MergeCommitTitle | None = None
+    merges_url: ApiUrl
+    milestones_url: ApiUrl
+    mirror_url: ApiUrl | None = None
     name: str
     node_id: str
-    notifications_url: HttpsUrl
+    notifications_url: ApiUrl
     open_issues: int
     open_issues_count: int
     owner: User
     private: bool
-    pulls_url: HttpsUrl
+    pulls_url: ApiUrl
     pushed_at: datetime
-    releases_url: HttpsUrl
+    releases_url: ApiUrl
     size: int
-    squash_merge_commit_message: SquashMergeCommitMessage | None = Field(default=None)
-    squash_merge_commit_title: SquashMergeCommitTitle | None = Field(default=None)
+    squash_merge_commit_message: SquashMergeCommitMessage | None = None
+    squash_merge_commit_title: SquashMergeCommitTitle | None = None
     ssh_url: str
     stargazers_count: int
-    stargazers_url: HttpsUrl
-    statuses_url: HttpsUrl
-    subscribers_url: HttpsUrl
-    subscription_url: HttpsUrl
-    svn_url: HttpsUrl
-    tags_url: HttpsUrl
-    teams_url: HttpsUrl
+    stargazers_url: ApiUrl
+    statuses_url: ApiUrl
+    subscribers_url: ApiUrl
+    subscription_url: ApiUrl
+    svn_url: ApiUrl
+    tags_url: ApiUrl
+    teams_url: ApiUrl
     topics: list[str]
-    trees_url: HttpsUrl
+    trees_url: ApiUrl
     updated_at: datetime
-    url: HttpsUrl
-    use_squash_pr_title_as_default: bool | None = Field(default=None)
+    url: ApiUrl
+    use_squash_pr_title_as_default: bool | None = None
     visibility: RepoVisibility
     watchers: int
     watchers_count: int
     web_commit_signoff_required: bool
 
 
-class BaseRef(BaseModel):
+class BaseRef(FrozenPayloadModel):
     label: str
     ref: str
     repo: Repository
@@ -270,137 +281,137 @@ class BaseRef(BaseModel):
     user: User
 
 
-class HookLastResponse(BaseModel):
-    code: int | None = Field(default=None)
-    status: str | None = Field(default=None)
-    message: str | None = Field(default=None)
+class HookLastResponse(PayloadModel):
+    code: int | None = None
+    status: str | None = None
+    message: str | None = None
 
 
-class Hook(BaseModel):
+class Hook(FrozenPayloadModel):
     type: HookType
     id: int
-    app_id: int | None = Field(default=None)
+    app_id: int | None = None
     name: Literal["web"]
     active: bool
     events: list[str]
     config: dict
     updated_at: datetime
     created_at: datetime
-    url: HttpsUrl
-    test_url: HttpsUrl
-    ping_url: HttpsUrl
-    deliveries_url: HttpsUrl
+    url: ApiUrl
+    test_url: ApiUrl
+    ping_url: ApiUrl
+    deliveries_url: ApiUrl
     last_response: HookLastResponse
 
 
-class Organization(BaseModel):
+class Organization(PayloadModel):
     login: str
     id: int
     node_id: str
-    url: HttpsUrl
-    repos_url: HttpsUrl
-    events_url: HttpsUrl
-    hooks_url: HttpsUrl
-    issues_url: HttpsUrl
-    members_url: HttpsUrl
-    public_members_url: HttpsUrl
-    avatar_url: HttpsUrl
+    url: ApiUrl
+    repos_url: ApiUrl
+    events_url: ApiUrl
+    hooks_url: ApiUrl
+    issues_url: ApiUrl
+    members_url: ApiUrl
+    public_members_url: ApiUrl
+    avatar_url: ApiUrl
     description: str
 
 
-class UserMetadata(BaseModel):
-    date: datetime | None = Field(default=None)
-    email: EmailStr
+class UserMetadata(PayloadModel):
+    date: datetime | None = None
+    email: str
     name: str
-    username: str | None = Field(default=None)
+    username: str | None = None
 
 
 Team = ForwardRef("Team")
 
 
-class Team(BaseModel):
-    deleted: bool | None = Field(default=False)
-    description: str | None = Field(default=None)
+class Team(FrozenPayloadModel):
+    deleted: bool | None = False
+    description: str | None = None
     html_url: HttpsUrl
     id: int
-    members_url: HttpsUrl
+    members_url: ApiUrl
     name: str
     node_id: str
     notification_setting: NotificationSetting
-    parent: Team | None = Field(default=None)
+    parent: Team | None = None
     permission: str
     privacy: TeamPrivacy
-    repositories_url: HttpsUrl
+    repositories_url: ApiUrl
     slug: str
-    url: HttpsUrl
+    url: ApiUrl
 
 
-Team.model_rebuild()
-
-
-class AutoMergeStatus(BaseModel):
+class AutoMergeStatus(PayloadModel):
     commit_message: str
     commit_title: str
     enabled_by: User
     merge_method: MergeMethod
 
 
-class Label(BaseModel):
+class Label(PayloadModel):
     color: str
     default: bool
-    description: str | None = Field(default=None)
+    description: str | None = None
     id: int
     name: str
     node_id: str
-    url: HttpsUrl
+    url: ApiUrl
 
 
-class PullRequest(BaseModel):
+class PullRequest(FrozenPayloadModel):
     links: Links = Field(alias="_links")
     active_lock_reason: None
-    additions: int | None = Field(default=None)
-    assignee: User | None = Field(default=None)
+    additions: int | None = None
+    assignee: User | None = None
     assignees: list[User]
     author_association: AuthorAssociation
-    auto_merge: AutoMergeStatus | None = Field(default=None)
+    auto_merge: AutoMergeStatus | None = None
     base: BaseRef
-    body: str | None = Field(default=None)
-    changed_files: int | None = Field(default=None)
-    closed_at: datetime | None = Field(default=None)
-    comments: int | None = Field(default=None)
-    comments_url: HttpsUrl
-    commits: int | None = Field(default=None)
-    commits_url: HttpsUrl
+    body: str | None = None
+    changed_files: int | None = None
+    closed_at: datetime | None = None
+    comments: int | None = None
+    comments_url: ApiUrl
+    commits: int | None = None
+    commits_url: ApiUrl
     created_at: datetime
-    deletions: int | None = Field(default=None)
-    diff_url: HttpsUrl
+    deletions: int | None = None
+    diff_url: ApiUrl
     draft: bool
     head: BaseRef
-    html_url: HttpsUrl | None = Field(default=None)
+    html_url: HttpsUrl | None = None
     id: int
-    issue_url: HttpsUrl
+    issue_url: ApiUrl
     labels: list[Label]
     locked: bool
-    maintainer_can_modify: bool | None = Field(default=None)
-    merge_commit_sha: CommitHash | None = Field(default=None)
-    mergeable: bool | None = Field(default=None)
-    mergeable_state: str | None = Field(default=None)
-    merged: bool | None = Field(default=False)
-    merged_at: datetime | None = Field(default=None)
-    merged_by: User | None = Field(default=None)
-    milestone: str | None = Field(default=None)
+    maintainer_can_modify: bool | None = None
+    merge_commit_sha: CommitHash | None = None
+    mergeable: bool | None = None
+    mergeable_state: str | None = None
+    merged: bool | None = False
+    merged_at: datetime | None = None
+    merged_by: User | None = None
+    milestone: str | None = None
     node_id: str
     number: int
-    patch_url: HttpsUrl
-    rebaseable: bool | None = Field(default=None)
+    patch_url: ApiUrl
+    rebaseable: bool | None = None
     requested_reviewers: list[User]
     requested_teams: list[Team]
-    review_comment_url: HttpsUrl
-    review_comments: int | None = Field(default=None)
-    review_comments_url: HttpsUrl
+    review_comment_url: ApiUrl
+    review_comments: int | None = None
+    review_comments_url: ApiUrl
     state: PullRequestState
-    statuses_url: HttpsUrl
+    statuses_url: ApiUrl
     title: str
     updated_at: datetime
-    url: HttpsUrl
+    url: ApiUrl
     user: dict
+
+    # links is aliased from _links; allow populating it by name as well.
+    model_config = ConfigDict(populate_by_name=True)
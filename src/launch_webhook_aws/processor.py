@@ -1,109 +1,169 @@
-import hashlib
 import hmac
-import inspect
-import json
 import logging
-from typing import Callable
+import os
+import time
+from functools import cache
+from typing import Callable, Self
 
 import boto3
 from arn import Arn
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+from types_boto3_secretsmanager import Client as SecretsManagerClient
 
+from launch_webhook_aws.bitbucket_server.event import BitbucketServerWebhookEvent
+from launch_webhook_aws.event import ScmEvent
+from launch_webhook_aws.github.event import GithubWebhookEvent
 from launch_webhook_aws.rule import Rule
 from launch_webhook_aws.source import SourceEvent
 
 logger = logging.getLogger("processor")
 logger.setLevel(logging.DEBUG)
 
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get("SECRET_CACHE_TTL_SECONDS", "300"))
+
+
+@cache
+def default_secretsmanager_client() -> SecretsManagerClient:
+    return boto3.client("secretsmanager")
+
 
 class EventProcessor(BaseModel):
-    rules: list[Rule]
+    # A tuple, so the rule index can only change by assigning new rules, which
+    # re-runs index_rules through validate_assignment.
+    rules: tuple[Rule, ...]
     secretsmanager_client: Callable = Field(
-        default_factory=lambda: boto3.client("secretsmanager")
+        default_factory=default_secretsmanager_client
+    )
+    secret_cache_ttl_seconds: int = Field(default=SECRET_CACHE_TTL_SECONDS)
+    # Secret values keyed on ARN, alongside the monotonic time they were fetched.
+    _secret_cache: dict[str, tuple[float, bytes]] = PrivateAttr(default_factory=dict)
+    # Rules keyed on the webhook event type, action and owning organization or
+    # project they subscribe to, so an event is only matched against rules that
+    # could accept it.
+    _rule_index: dict[tuple[type[BaseModel], str, str], list[Rule]] = PrivateAttr(
+        default_factory=dict
     )
 
-    def process_raw_event(self, headers: dict[str, str], body: str) -> None:
-        raw_event = SourceEvent(headers=headers, body=json.loads(body))
-        source_event = raw_event.to_source_event()
+    model_config = ConfigDict(validate_assignment=True)
 
+    @model_validator(mode="after")
+    def index_rules(self) -> Self:
+        self._rule_index = {}
         for rule in self.rules:
-            if not rule.match(source_event.event):
-                continue
-
-            if rule.source.verify_signature:
-                try:
-                    if not self.verify_event_signature(
-                        event_signature=source_event.event.signature_hash_sha256,
-                        raw_event_body=body,
-                        signature_secret=rule.source.signature_secret,
-                    ):
-                        continue
-                except Exception:
-                    logger.exception(
-                        f"Failure while verifying event signature for {rule.source=}! This rule will not be processed further."
-                    )
-                    continue
+            # Deduplicated event values, so a rule listing an event twice is
+            # still only dispatched once per webhook.
+            for event_value in rule.source.event_values:
+                self._rule_index.setdefault(
+                    (
+                        rule.source.webhook_event_type,
+                        event_value,
+                        rule.source.owner_name,
+                    ),
+                    [],
+                ).append(rule)
+        return self
 
-            try:
-                transform_signature = inspect.signature(rule.transform)
-            except Exception:
-                logger.exception(
-                    "Failed to inspect transform function signature! This rule will not be processed further."
-                )
-                continue
+    def process_raw_event(self, headers: dict[str, str], body: str | bytes) -> None:
+        raw_event = SourceEvent(headers=headers, body=body)
+        self.process_event(raw_event.to_source_event(), raw_event_body=body)
 
-            try:
-                if transform_signature.parameters["event"].annotation is dict:
-                    event = source_event.event.model_dump()
-                else:
-                    event = source_event.event
-            except Exception:
-                logger.exception(
-                    "Failed to transform event into the expected type! This rule will not be processed further."
-                )
-                continue
+    def process_event(
+        self,
+        source_event: BitbucketServerWebhookEvent | GithubWebhookEvent,
+        raw_event_body: str | bytes,
+    ) -> None:
+        """Runs an already parsed webhook event through the rules subscribed to it.
 
-            try:
-                logger.debug("Transforming event...")
-                transformed_event = rule.transform(event=event)
-                logger.debug("Event transform complete, invoking destination")
-            except Exception:
-                logger.exception(
-                    "Failed to transform event! This rule will not be processed further."
-                )
-                continue
+        The raw body is still required, as signatures are verified against the bytes
+        that were received rather than the parsed event.
+        """
+        event = source_event.event
+        rules = self._rule_index.get(
+            (type(source_event), event.action_type, event.owner_name), []
+        )
+        if not rules:
+            logger.debug(
+                "No rules subscribe to %s events from %s",
+                event.action_type,
+                event.owner_name,
+            )
+        for rule in rules:
+            if rule.match(event):
+                self.process_rule(rule, event, raw_event_body)
 
+    def process_rule(
+        self, rule: Rule, event: ScmEvent, raw_event_body: str | bytes
+    ) -> None:
+        if rule.source.verify_signature:
             try:
-                rule.destination.invoke(transformed_event=transformed_event)
-                logger.debug("Invoked destination successfully")
+                if not self.verify_event_signature(
+                    event_signature=event.signature_hash_sha256,
+                    raw_event_body=raw_event_body,
+                    signature_secret=rule.source.signature_secret,
+                ):
+                    return
             except Exception:
                 logger.exception(
-                    "Failed to invoke destination! Nothing further can be processed for this rule."
+                    f"Failure while verifying event signature for {rule.source=}! This rule will not be processed further."
                 )
-                continue
+                return
+
+        try:
+            logger.debug("Transforming event...")
+            transformed_event = rule.transform(
+                event=event.model_dump() if rule.transform_takes_dict else event
+            )
+            logger.debug("Event transform complete, invoking destination")
+        except Exception:
+            logger.exception(
+                "Failed to transform event! This rule will not be processed further."
+            )
+            return
+
+        try:
+            rule.destination.invoke(transformed_event=transformed_event)
+            logger.debug("Invoked destination successfully")
+        except Exception:
+            logger.exception(
+                "Failed to invoke destination! Nothing further can be processed for this rule."
+            )
+
+    def get_signature_secret(self, signature_secret: Arn) -> bytes:
+        secret_id = str(signature_secret)
+        now = time.monotonic()
+        cached = self._secret_cache.get(secret_id)
+        if cached and now - cached[0] < self.secret_cache_ttl_seconds:
+            return cached[1]
+
+        secret = self.secretsmanager_client.get_secret_value(SecretId=secret_id)[
+            "SecretString"
+        ].encode("utf-8")
+        self._secret_cache[secret_id] = (now, secret)
+        return secret
 
     def verify_event_signature(
-        self, event_signature: str, raw_event_body: str, signature_secret: Arn
+        self, event_signature: str, raw_event_body: str | bytes, signature_secret: Arn
     ) -> bool:
         try:
-            secret = self.secretsmanager_client.get_secret_value(
-                SecretId=str(signature_secret)
-            )["SecretString"]
+            secret = self.get_signature_secret(signature_secret)
         except Exception:
             logger.exception(
                 f"Failed to retrieve {signature_secret=} from Secrets Manager!"
             )
             raise
 
-        hash_object = hmac.new(
-            secret.encode("utf-8"),
-            msg=raw_event_body.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        )
-        calculated_signature = f"sha256={hash_object.hexdigest()}"
-        if hmac.compare_digest(calculated_signature, event_signature):
+        # Callers should pass the body as received; str bodies are only encoded
+        # here for callers that have already decoded it.
+        if isinstance(raw_event_body, str):
+            raw_event_body = raw_event_body.encode("utf-8")
+
+        digest = hmac.digest(secret, raw_event_body, "sha256")
+        algorithm, _, hex_signature = event_signature.partition("=")
+        try:
+            expected_digest = bytes.fromhex(hex_signature)
+        except ValueError:
+            expected_digest = b""
+        if algorithm == "sha256" and hmac.compare_digest(digest, expected_digest):
             return True
-        logger.error(
-            f"Signature verification failed for {event_signature=}; {calculated_signature=}."
-        )
+        logger.error(f"Signature verification failed for {event_signature=}.")
         return False
@@ -1,9 +1,16 @@
 import importlib
 import inspect
-from types import GenericAlias
-from typing import Callable, Self
+from functools import lru_cache
+from typing import Callable, Self, get_origin
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 from launch_webhook_aws.bitbucket_server.event import BitbucketServerEvent
 from launch_webhook_aws.destination import DestinationSpec
@@ -17,16 +24,96 @@ from launch_webhook_aws.transform import (
 )
 
 
+@lru_cache(maxsize=256)
+def inspect_transform(transform: Callable) -> bool:
+    """Validates a transform's signature, returning whether it takes the event as a dict.
+
+    Many rules share a transform (default_transform in particular), so the result is
+    cached per callable. Invalid signatures raise ValueError, which is not cached.
+    """
+    transform_signature = inspect.signature(transform)
+
+    if "event" not in transform_signature.parameters:
+        raise ValueError("Rule transform function must accept an event parameter!")
+
+    event_annotation = transform_signature.parameters["event"].annotation
+    # get_origin unwraps generics such as dict[str, Any] and typing.Dict
+    event_origin = get_origin(event_annotation) or event_annotation
+
+    if event_origin is not dict and not (
+        isinstance(event_origin, type) and issubclass(event_origin, ScmEvent)
+    ):
+        raise ValueError(
+            "Rule transform event parameter must be annotated to accept a dict or a subclass of ScmEvent"
+        )
+
+    return_annotation = transform_signature.return_annotation
+    return_origin = get_origin(return_annotation)
+
+    if return_origin is not None:
+        if return_origin is not dict:
+            raise ValueError(
+                "Rule transform return annotation must be dict if using generics!"
+            )
+    elif return_annotation is not dict and return_annotation is not TransformResult:
+        raise ValueError(
+            "Rule transform return annotation must be TransformResult or dict!"
+        )
+    return event_origin is dict
+
+
+@lru_cache(maxsize=256)
+def import_transform(value: str) -> Callable:
+    """Imports a transform given as a 'module.function' string.
+
+    Rules loaded from config commonly name the same transform, so each string is
+    resolved once. Failures raise ValueError, which is not cached.
+    """
+    parts = value.split(".")
+    if len(parts) < 2:
+        raise ValueError(
+            "Rule transform provided as a string must be in the format 'module.function'"
+        )
+    module_name = ".".join(parts[:-1])
+    function_name = parts[-1]
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError:
+        raise ValueError(f"Rule transform module {module_name} not found!")
+    except ImportError:
+        raise ValueError(f"Rule transform module {module_name} could not be imported!")
+
+    try:
+        func = getattr(module, function_name)
+    except AttributeError:
+        raise ValueError(
+            f"Rule transform function {function_name} not found in module {module_name}!"
+        )
+
+    if not callable(func):
+        raise ValueError(f"Rule transform function {value} is not callable!")
+    return func
+
+
 class Rule(BaseModel):
-    source: SourceSpec
+    # Processors index rules on their source, so it can't be reassigned; the
+    # destination and transform can.
+    source: SourceSpec = Field(frozen=True)
     transform: RuleTransform = Field(default=default_transform)
     destination: DestinationSpec
+    # Whether the transform wants the event as a dict rather than a model,
+    # resolved once from its signature when the rule is validated.
+    _transform_takes_dict: bool = PrivateAttr(default=False)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def match(self, event: GithubEvent | BitbucketServerEvent) -> bool:
         return self.source.match(event)
 
+    @property
+    def transform_takes_dict(self) -> bool:
+        return self._transform_takes_dict
+
     @field_validator("transform", mode="before")
     @classmethod
     def handle_transform_import(cls, value: RuleTransform) -> Callable:
@@ -34,32 +121,7 @@ class Rule(BaseModel):
         if callable(value):
             return value
         elif isinstance(value, str):
-            parts = value.split(".")
-            if len(parts) < 2:
-                raise ValueError(
-                    "Rule transform provided as a string must be in the format 'module.function'"
-                )
-            module_name = ".".join(parts[:-1])
-            function_name = parts[-1]
-            try:
-                module = importlib.import_module(module_name)
-            except ModuleNotFoundError:
-                raise ValueError(f"Rule transform module {module_name} not found!")
-            except ImportError:
-                raise ValueError(
-                    f"Rule transform module {module_name} could not be imported!"
-                )
-
-            try:
-                func = getattr(module, function_name)
-            except AttributeError:
-                raise ValueError(
-                    f"Rule transform function {function_name} not found in module {module_name}!"
-                )
-
-            if not callable(func):
-                raise ValueError(f"Rule transform function {value} is not callable!")
-            return func
+            return import_transform(value)
         else:
             raise ValueError("Provided transform must be a callable or a string!")
 
@@ -70,35 +132,9 @@ class Rule(BaseModel):
         The transform function must accept a parameter named event, which must be annotated as a dict or a
         subclass of ScmEvent. The function must annotate its return type as dict.
         """
-        transform_signature = inspect.signature(self.transform)
-
-        if "event" not in transform_signature.parameters:
-            raise ValueError("Rule transform function must accept an event parameter!")
-
-        event_annotation = transform_signature.parameters["event"].annotation
-
-        if event_annotation is not dict and type(event_annotation) is GenericAlias:
-            if event_annotation.__origin__ is not dict:
-                raise ValueError(
-                    "Rule transform event parameter must be annotated to accept a dict or a subclass of ScmEvent"
-                )
-        elif event_annotation is not dict:
-            if not issubclass(event_annotation, ScmEvent):
-                raise ValueError(
-                    "Rule transform event parameter must be annotated to accept a dict or a subclass of ScmEvent"
-                )
-
-        if type(transform_signature.return_annotation) is GenericAlias:
-            if transform_signature.return_annotation.__origin__ is not dict:
-                raise ValueError(
-                    "Rule transform return annotation must be dict if using generics!"
-                )
-        elif transform_signature.return_annotation is dict:
-            pass
-        elif transform_signature.return_annotation is TransformResult:
-            pass
-        else:
-            raise ValueError(
-                "Rule transform return annotation must be TransformResult or dict!"
-            )
+        try:
+            self._transform_takes_dict = inspect_transform(self.transform)
+        except TypeError:
+            # Unhashable callables can't be cached, so inspect them every time.
+            self._transform_takes_dict = inspect_transform.__wrapped__(self.transform)
         return self
@@ -1,14 +1,18 @@
 import logging
 from enum import StrEnum
-from re import Pattern, compile
-from typing import Annotated, Any, Literal, Self, TypeAlias, Union
+from functools import lru_cache
+from re import Pattern, compile, error
+from typing import Annotated, Any, ClassVar, Literal, Self, TypeAlias, Union
 
 from pydantic import (
     BaseModel,
-    BeforeValidator,
     ConfigDict,
     Discriminator,
     Field,
+    Json,
+    PlainSerializer,
+    PlainValidator,
+    PrivateAttr,
     Tag,
     model_validator,
 )
@@ -19,7 +23,6 @@ from launch_webhook_aws.github import event as github_event
 from launch_webhook_aws.type import Arn
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 class SourceType(StrEnum):
@@ -29,6 +32,30 @@ class SourceType(StrEnum):
     GITHUB_ENTERPRISE = "github_enterprise"
 
 
+def build_bitbucket_server_webhook_event(
+    headers: bitbucket_server_event.BitbucketServerHeaders, body: dict[str, Any]
+) -> bitbucket_server_event.BitbucketServerWebhookEvent:
+    event = bitbucket_server_event.BitbucketServerEventAdapter.validate_python(
+        dict(body, headers=headers)
+    )
+    return bitbucket_server_event.BitbucketServerWebhookEvent.model_construct(
+        headers=headers, event=event
+    )
+
+
+def build_github_webhook_event(
+    headers: github_event.GithubHeaders, body: dict[str, Any]
+) -> github_event.GithubWebhookEvent:
+    event = github_event.parse_github_event(headers, body)
+    return github_event.GithubWebhookEvent.model_construct(headers=headers, event=event)
+
+
+WEBHOOK_EVENT_BUILDERS = {
+    bitbucket_server_event.BitbucketServerHeaders: build_bitbucket_server_webhook_event,
+    github_event.GithubHeaders: build_github_webhook_event,
+}
+
+
 class SourceEvent(BaseModel):
     headers: Annotated[
         (
@@ -39,7 +66,9 @@ class SourceEvent(BaseModel):
         ),
         Discriminator(discriminate_headers),
     ]
-    body: dict[str, Any]
+    # Raw JSON bodies are parsed by pydantic-core while validating, avoiding a
+    # separate json.loads pass over the payload.
+    body: dict[str, Any] | Json[dict[str, Any]]
 
     def to_source_event(
         self,
@@ -47,55 +76,97 @@ class SourceEvent(BaseModel):
         bitbucket_server_event.BitbucketServerWebhookEvent
         | github_event.GithubWebhookEvent
     ):
-        if isinstance(self.headers, bitbucket_server_event.BitbucketServerHeaders):
-            return bitbucket_server_event.BitbucketServerWebhookEvent(
-                headers=self.headers, event={"headers": self.headers, **self.body}
-            )
-        elif isinstance(self.headers, github_event.GithubHeaders):
-            return github_event.GithubWebhookEvent(
-                headers=self.headers,
-                event={
-                    "headers": self.headers,
-                    "header_event": self.headers.x_github_event,
-                    **self.body,
-                },
-            )
+        return WEBHOOK_EVENT_BUILDERS[type(self.headers)](self.headers, self.body)
+
 
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str) -> Pattern:
+    return compile(pattern)
 
-def validate_patterns(value: ...) -> list[Pattern]:
-    patterns = []
+
+def validate_patterns(value: ...) -> tuple[Pattern, ...]:
     if value is None:
-        return []
+        return ()
     if isinstance(value, (str, Pattern)):
         value = [value]
-    if not isinstance(value, list):
+    if not isinstance(value, (list, tuple)):
         raise ValueError(
             "must be a list of patterns or strings that can become patterns"
         )
-    for pattern in value:
-        if isinstance(pattern, Pattern):
-            patterns.append(pattern)
-        else:
-            try:
-                patterns.append(compile(pattern))
-            except Exception as e:
-                raise ValueError(
-                    "must be a list of patterns or strings that can become patterns"
-                ) from e
-    return patterns
+    try:
+        return tuple(
+            pattern if isinstance(pattern, Pattern) else compile_pattern(pattern)
+            for pattern in value
+        )
+    except Exception as e:
+        raise ValueError(
+            "must be a list of patterns or strings that can become patterns"
+        ) from e
 
 
-PatternList = Annotated[list[Pattern], BeforeValidator(validate_patterns)]
+def serialize_patterns(patterns: tuple[Pattern, ...]) -> list[str | bytes]:
+    return [pattern.pattern for pattern in patterns]
+
+
+# validate_patterns already returns a tuple of compiled patterns, so it replaces
+# pydantic's per-item Pattern validation. The serializer is spelled out because
+# pydantic's own Pattern serializer isn't kept with a plain validator.
+PatternTuple = Annotated[
+    tuple[Pattern, ...],
+    PlainValidator(validate_patterns),
+    PlainSerializer(serialize_patterns, when_used="json"),
+]
+
+
+def combine_patterns(patterns: tuple[Pattern, ...]) -> Pattern | None:
+    """Fuses patterns into one alternation so matching a name is a single search.
+
+    Returns None when the patterns can't be combined safely: when their flags differ,
+    when they contain groups that a backreference might rely on, or when the fused
+    expression doesn't compile (e.g. inline global flags such as ``(?i)``).
+    """
+    if len(patterns) == 1:
+        return patterns[0]
+    if (
+        not patterns
+        or len({pattern.flags for pattern in patterns}) != 1
+        or any(pattern.groups for pattern in patterns)
+        or not all(isinstance(pattern.pattern, str) for pattern in patterns)
+    ):
+        return None
+    try:
+        return compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+            patterns[0].flags,
+        )
+    except error:
+        return None
+
+
+def search_patterns(
+    combined: Pattern | None, patterns: tuple[Pattern, ...], value: str
+) -> bool:
+    if combined is not None:
+        return combined.search(value) is not None
+    return any(pattern.search(value) for pattern in patterns)
 
 
 class SourceBase(BaseModel):
     type: SourceType
-    include_repositories: PatternList = Field(default_factory=list)
-    exclude_repositories: PatternList = Field(default_factory=list)
+    # Narrowed to the provider's EventType by each subclass. Events and patterns
+    # are tuples so the values derived from them in model_post_init can't go
+    # stale through in-place edits.
+    events: tuple[StrEnum, ...]
+    include_repositories: PatternTuple = Field(default=())
+    exclude_repositories: PatternTuple = Field(default=())
     verify_signature: bool = Field(default=False)
     signature_secret: Arn | None = Field(default=None)
 
-    model_config = ConfigDict(extra="forbid")
+    _include_pattern: Pattern | None = PrivateAttr(default=None)
+    _exclude_pattern: Pattern | None = PrivateAttr(default=None)
+    _event_values: frozenset[str] = PrivateAttr(default=frozenset())
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     @model_validator(mode="after")
     def check_signature_secret_configuration(self) -> Self:
@@ -103,111 +174,109 @@ class SourceBase(BaseModel):
             raise ValueError("signature_secret must be set if verify_signature is True")
         return self
 
+    def model_post_init(self, context: Any) -> None:
+        self._include_pattern = combine_patterns(self.include_repositories)
+        self._exclude_pattern = combine_patterns(self.exclude_repositories)
+        self._event_values = frozenset(event.value for event in self.events)
+
+    @property
+    def event_values(self) -> frozenset[str]:
+        return self._event_values
+
+    def match_repository(self, repository_name: str) -> bool:
+        if not self.include_repositories:
+            logger.debug(
+                "No source include patterns defined, this repository is included by default."
+            )
+        elif search_patterns(
+            self._include_pattern, self.include_repositories, repository_name
+        ):
+            logger.debug(
+                "Repository name %s matched source include patterns", repository_name
+            )
+        else:
+            logger.debug(
+                "Repository name %s did not match source include patterns",
+                repository_name,
+            )
+            return False
+
+        if self.exclude_repositories and search_patterns(
+            self._exclude_pattern, self.exclude_repositories, repository_name
+        ):
+            logger.debug(
+                "Repository name %s matched source exclude patterns", repository_name
+            )
+            return False
+        return True
+
 
 class GithubSource(SourceBase):
     type: Literal[SourceType.GITHUB]
     organization: str
-    events: list[github_event.EventType]
+    events: tuple[github_event.EventType, ...]
+
+    webhook_event_type: ClassVar[type[BaseModel]] = github_event.GithubWebhookEvent
 
     def match(self, event: github_event.GithubEvent) -> bool:
-        if not issubclass(type(event), github_event.GithubEvent):
-            logger.debug(f"Event source mismatch: {type(event)} is not a GithubEvent")
+        if not isinstance(event, github_event.GithubEvent):
+            logger.debug("Event source mismatch: %s is not a GithubEvent", type(event))
             return False
-        if event.action_type not in self.events:
+        if event.action_type not in self._event_values:
             logger.debug(
-                f"Event action mismatch: {event.action_type} not in {[e.value for e in self.events]}"
+                "Event action mismatch: %s not in %s",
+                event.action_type,
+                sorted(self._event_values),
             )
             return False
         if event.organization_name != self.organization:
             logger.debug(
-                f"Organization mismatch: {event.organization_name} != {self.organization}"
+                "Organization mismatch: %s != %s",
+                event.organization_name,
+                self.organization,
             )
             return False
 
-        inclusion_match = False
-        exclusion_match = False
+        return self.match_repository(event.repository.name)
 
-        if not self.include_repositories:
-            logger.debug(
-                "No source repository include patterns defined, this repository is included by default."
-            )
-            inclusion_match = True
-        else:
-            for include_repo in self.include_repositories:
-                if include_repo.search(event.repository.name):
-                    logger.debug(
-                        f"Repository name {event.repository.name} matched source include pattern {include_repo}"
-                    )
-                    inclusion_match = True
-                else:
-                    logger.debug(
-                        f"Repository name {event.repository.name} did not match source include pattern {include_repo}"
-                    )
-        if self.exclude_repositories:
-            for exclude_repo in self.exclude_repositories:
-                if exclude_repo.search(event.repository.name):
-                    logger.debug(
-                        f"Repository name {event.repository.name} matched source exclude pattern {exclude_repo}"
-                    )
-                    exclusion_match = True
-
-        if inclusion_match and not exclusion_match:
-            return True
-        return False
+    @property
+    def owner_name(self) -> str:
+        return self.organization
 
 
 class BitbucketServerSource(SourceBase):
     type: Literal[SourceType.BITBUCKET_SERVER]
     project_key: str
-    events: list[bitbucket_server_event.EventType]
+    events: tuple[bitbucket_server_event.EventType, ...]
+
+    webhook_event_type: ClassVar[type[BaseModel]] = (
+        bitbucket_server_event.BitbucketServerWebhookEvent
+    )
 
     def match(self, event: bitbucket_server_event.BitbucketServerEvent) -> bool:
-        if not issubclass(type(event), bitbucket_server_event.BitbucketServerEvent):
+        if not isinstance(event, bitbucket_server_event.BitbucketServerEvent):
             logger.debug(
-                f"Event source mismatch: {type(event)} is not a BitbucketServerEvent"
+                "Event source mismatch: %s is not a BitbucketServerEvent", type(event)
             )
             return False
-        if event.event_key not in [event_type.value for event_type in self.events]:
+        if event.event_key not in self._event_values:
             logger.debug(
-                f"Event action mismatch: {event.event_key} not in {[e.value for e in self.events]}"
+                "Event action mismatch: %s not in %s",
+                event.event_key,
+                sorted(self._event_values),
             )
             return False
         if event.project_key != self.project_key:
             logger.debug(
-                f"Project key mismatch: {event.project_key} != {self.project_key}"
+                "Project key mismatch: %s != %s", event.project_key, self.project_key
             )
             return False
 
-        inclusion_match = False
-        exclusion_match = False
+        return self.match_repository(event.repository_name)
 
-        if not self.include_repositories:
-            logger.debug(
-                "No source include patterns defined, this repository is included by default."
-            )
-            inclusion_match = True
-        else:
-            for include_repo in self.include_repositories:
-                if include_repo.search(event.repository_name):
-                    logger.debug(
-                        f"Repository name {event.repository_name} matched source include pattern {include_repo}"
-                    )
-                    inclusion_match = True
-                else:
-                    logger.debug(
-                        f"Repository name {event.repository_name} did not match source include pattern {include_repo}"
-                    )
-        if self.exclude_repositories:
-            for exclude_repo in self.exclude_repositories:
-                if exclude_repo.search(event.repository_name):
-                    logger.debug(
-                        f"Repository name {event.repository_name} matched source exclude pattern {exclude_repo}"
-                    )
-                    exclusion_match = True
-
-        if inclusion_match and not exclusion_match:
-            return True
-        return False
+    @property
+    def owner_name(self) -> str:
+        return self.project_key
 
 
 SourceSpec: TypeAlias = Annotated[
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated, Any, TypeAlias
 
 import arn
@@ -11,10 +12,22 @@ from pydantic import (
 SshUrl: TypeAlias = Annotated[HttpUrl, UrlConstraints(allowed_schemes=["ssh"])]
 HttpsUrl: TypeAlias = Annotated[HttpUrl, UrlConstraints(allowed_schemes=["https"])]
 GitUrl: TypeAlias = Annotated[HttpUrl, UrlConstraints(allowed_schemes=["git"])]
+# Webhook payloads carry dozens of API links and URI templates that are never
+# dereferenced here, so they are kept as strings rather than parsed as URLs.
+ApiUrl: TypeAlias = str
 CommitHash: TypeAlias = Annotated[str, StringConstraints(pattern=r"^[0-9a-fA-F]{40}$")]
 
 
+@lru_cache(maxsize=1024)
+def parse_arn(value: str) -> arn.Arn:
+    # The same ARNs are validated each time rules are loaded; parsed ARNs are
+    # treated as read-only, so one instance can be shared.
+    return arn.Arn(value)
+
+
 def validate_arn(v: Any) -> arn.Arn:
+    if isinstance(v, str):
+        return parse_arn(v)
     return arn.Arn(v)
 
 
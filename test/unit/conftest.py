@@ -1,9 +1,11 @@
 import hashlib
 import hmac
+import io
 import json
 import os
 import pathlib
 import zipfile
+from functools import cache
 from typing import Callable
 from unittest.mock import MagicMock
 
@@ -28,15 +30,20 @@ def aws_credentials():
     os.environ["MOTO_ACCOUNT_ID"] = "123456789012"
 
 
-@pytest.fixture
+@cache
+def read_test_file(path: str) -> str:
+    return pathlib.Path(path).read_text()
+
+
+@pytest.fixture(scope="session")
 def test_file():
     def _test_file(path: pathlib.Path) -> dict:
-        return path.read_text()
+        return read_test_file(str(path))
 
     return _test_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_json(test_file):
     def _test_json(path: pathlib.Path) -> dict:
         return json.loads(test_file(path))
@@ -50,11 +57,9 @@ def make_hmac_signature(
     digest_function: Callable = hashlib.sha256,
     prefix: str | None = None,
 ) -> str:
-    signature_hash = hmac.new(
-        secret.encode("utf-8"),
-        msg=body.encode("utf-8"),
-        digestmod=digest_function,
-    ).hexdigest()
+    signature_hash = hmac.digest(
+        secret.encode("utf-8"), body.encode("utf-8"), digest_function
+    ).hex()
 
     if prefix is None:
         if digest_function == hashlib.sha256:
@@ -65,32 +70,36 @@ def make_hmac_signature(
     return f"{prefix}={signature_hash}"
 
 
-@pytest.fixture
+@cache
+def load_test_event(event_source: str, file_name: str) -> tuple[dict, str]:
+    event_headers = json.loads(
+        read_test_file(f"test/data/headers/{event_source}/{file_name}")
+    )
+    event_body = read_test_file(f"test/data/events/{event_source}/{file_name}")
+
+    if "X-Request-Id" in event_headers:
+        event_headers["X-Hub-Signature"] = make_hmac_signature(
+            body=event_body, secret="unit-test"  # pragma: allowlist secret
+        )
+    if "X-Github-Delivery" in event_headers:
+        event_headers["X-Hub-Signature"] = make_hmac_signature(
+            body=event_body,
+            secret="unit-test",  # pragma: allowlist secret
+            digest_function=hashlib.sha1,
+        )
+        event_headers["X-Hub-Signature-256"] = make_hmac_signature(
+            body=event_body, secret="unit-test"  # pragma: allowlist secret
+        )
+
+    return event_headers, event_body
+
+
+@pytest.fixture(scope="session")
 def test_event():
     def _test_event(event_source: str, file_name: str) -> tuple[dict, str]:
-        event_header_file = pathlib.Path(
-            f"test/data/headers/{event_source}/{file_name}"
-        )
-        event_headers = json.loads(event_header_file.read_text())
-        event_body = pathlib.Path(
-            f"test/data/events/{event_source}/{file_name}"
-        ).read_text()
-
-        if "X-Request-Id" in event_headers:
-            event_headers["X-Hub-Signature"] = make_hmac_signature(
-                body=event_body, secret="unit-test"  # pragma: allowlist secret
-            )
-        if "X-Github-Delivery" in event_headers:
-            event_headers["X-Hub-Signature"] = make_hmac_signature(
-                body=event_body,
-                secret="unit-test",  # pragma: allowlist secret
-                digest_function=hashlib.sha1,
-            )
-            event_headers["X-Hub-Signature-256"] = make_hmac_signature(
-                body=event_body, secret="unit-test"  # pragma: allowlist secret
-            )
-
-        return event_headers, event_body
+        event_headers, event_body = load_test_event(event_source, file_name)
+        # Tests may tamper with the headers, so each gets its own copy.
+        return dict(event_headers), event_body
 
     return _test_event
 
@@ -106,210 +115,184 @@ def mock_rules_from_file(test_json):
     return _mock_rules_from_file
 
 
-@pytest.fixture
-def mock_assumable_role(aws_credentials):
-    with mock_aws():
-        iam_client: IAMClient = boto3.client("iam")
-        result = iam_client.create_role(
-            RoleName="unit-test-assumable-role",
-            AssumeRolePolicyDocument=json.dumps(
+ASSUMABLE_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"AWS": "arn:aws:iam::123456789012:root"},
+                "Action": "sts:AssumeRole",
+                "Condition": {"StringEquals": {"sts:ExternalId": "unit-test"}},
+            }
+        ],
+    }
+)
+# Trust policies for the roles the destination services run as, keyed on service.
+SERVICE_ROLE_POLICIES = {
+    service: json.dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
                 {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"AWS": "arn:aws:iam::123456789012:root"},
-                            "Action": "sts:AssumeRole",
-                            "Condition": {
-                                "StringEquals": {"sts:ExternalId": "unit-test"}
-                            },
-                        }
-                    ],
+                    "Effect": "Allow",
+                    "Principal": {"Service": f"{service}.amazonaws.com"},
+                    "Action": "sts:AssumeRole",
                 }
-            ),
-        )
-        yield result["Role"]["Arn"]
+            ],
+        }
+    )
+    for service in ("lambda", "codepipeline", "codebuild")
+}
 
 
-@pytest.fixture
-def mock_secretsmanager_secret(aws_credentials):
+@pytest.fixture(scope="session")
+def mock_aws_session(aws_credentials):
+    """A single moto mock shared by the AWS resource fixtures below.
+
+    The resources are created once per session rather than per test. The mock
+    is only torn down at the end of the session, so once the first test
+    requests an AWS fixture, every later test runs under moto as well.
+    """
     with mock_aws():
-        client: SecretsManagerClient = boto3.client("secretsmanager")
-        result = client.create_secret(Name="unit-test-secret", SecretString="unit-test")
-        yield result["ARN"]
+        yield
 
 
-@pytest.fixture
-def build_zipped_lambda_code(tmp_path):
-    function_zip = tmp_path.joinpath("function.zip")
+@pytest.fixture(scope="session")
+def boto3_session(mock_aws_session) -> boto3.session.Session:
+    """One boto3 session for the resource fixtures, so its loaders are set up once."""
+    return boto3.session.Session()
+
+
+@pytest.fixture(scope="session")
+def mock_assumable_role(boto3_session):
+    iam_client: IAMClient = boto3_session.client("iam")
+    result = iam_client.create_role(
+        RoleName="unit-test-assumable-role",
+        AssumeRolePolicyDocument=ASSUMABLE_ROLE_POLICY,
+    )
+    yield result["Role"]["Arn"]
+
+
+@pytest.fixture(scope="session")
+def mock_secretsmanager_secret(boto3_session):
+    client: SecretsManagerClient = boto3_session.client("secretsmanager")
+    result = client.create_secret(Name="unit-test-secret", SecretString="unit-test")
+    yield result["ARN"]
+
+
+@pytest.fixture(scope="session")
+def mock_service_roles(boto3_session) -> dict[str, str]:
+    """Creates one role per destination service, returning their ARNs by service."""
+    iam_client: IAMClient = boto3_session.client("iam")
+    role_arns = {}
+    for service, policy in SERVICE_ROLE_POLICIES.items():
+        result = iam_client.create_role(
+            RoleName=f"unit-test-{service}-role",
+            AssumeRolePolicyDocument=policy,
+        )
+        role_arns[service] = result["Role"]["Arn"]
+    return role_arns
+
+
+@pytest.fixture(scope="session")
+def build_zipped_lambda_code():
+    function_zip = io.BytesIO()
     with zipfile.ZipFile(function_zip, "w") as zf:
         zf.writestr(
             "lambda_function.py",
             pathlib.Path("test/data/sample_function.py").read_text(),
         )
-    yield function_zip.read_bytes()
+    yield function_zip.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_lambda_function(
-    aws_credentials, mock_assumable_role, build_zipped_lambda_code
+    boto3_session, mock_service_roles, mock_assumable_role, build_zipped_lambda_code
 ):
-    with mock_aws():
-        iam_client: IAMClient = boto3.client("iam")
-        lambda_client: LambdaClient = boto3.client("lambda")
-        iam_role = iam_client.create_role(
-            RoleName="unit-test-lambda-role",
-            AssumeRolePolicyDocument=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Service": "lambda.amazonaws.com"},
-                            "Action": "sts:AssumeRole",
-                        }
-                    ],
-                }
-            ),
-        )
+    lambda_client: LambdaClient = boto3_session.client("lambda")
 
-        result = lambda_client.create_function(
-            FunctionName="unit-test-function",
-            Code={"ZipFile": build_zipped_lambda_code},
-            Handler="lambda_function.lambda_handler",
-            Role=iam_role["Role"]["Arn"],
-            Runtime="python3.13",
-        )
-
-        yield result["FunctionArn"]
+    result = lambda_client.create_function(
+        FunctionName="unit-test-function",
+        Code={"ZipFile": build_zipped_lambda_code},
+        Handler="lambda_function.lambda_handler",
+        Role=mock_service_roles["lambda"],
+        Runtime="python3.13",
+    )
 
-
-@pytest.fixture
-def mock_s3_bucket(aws_credentials):
-    with mock_aws():
-        s3_client = boto3.client("s3")
-        bucket_name = "unit-test-bucket"
-        s3_client.create_bucket(Bucket=bucket_name)
-        yield bucket_name
+    yield result["FunctionArn"]
 
 
-@pytest.fixture
-def mock_codepipeline_pipeline(aws_credentials, mock_assumable_role, mock_s3_bucket):
-    with mock_aws():
-        iam_client: IAMClient = boto3.client("iam")
-        codepipeline_client: CodePipelineClient = boto3.client("codepipeline")
+@pytest.fixture(scope="session")
+def mock_s3_bucket(boto3_session):
+    s3_client = boto3_session.client("s3")
+    bucket_name = "unit-test-bucket"
+    s3_client.create_bucket(Bucket=bucket_name)
+    yield bucket_name
 
-        iam_role = iam_client.create_role(
-            RoleName="unit-test-codepipeline-role",
-            AssumeRolePolicyDocument=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Service": "codepipeline.amazonaws.com"},
-                            "Action": "sts:AssumeRole",
-                        }
-                    ],
-                }
-            ),
-        )
 
-        result = codepipeline_client.create_pipeline(
-            pipeline={
-                "name": "unit-test-pipeline",
-                "roleArn": iam_role["Role"]["Arn"],
-                "artifactStore": {
-                    "type": "S3",
-                    "location": mock_s3_bucket,
+@pytest.fixture(scope="session")
+def mock_codepipeline_pipeline(
+    boto3_session, mock_service_roles, mock_assumable_role, mock_s3_bucket
+):
+    codepipeline_client: CodePipelineClient = boto3_session.client("codepipeline")
+
+    source_stage = {
+        "name": "Source",
+        "actions": [
+            {
+                "name": "SourceAction",
+                "actionTypeId": {
+                    "category": "Source",
+                    "owner": "AWS",
+                    "provider": "S3",
+                    "version": "1",
+                },
+                "configuration": {
+                    "S3Bucket": mock_s3_bucket,
+                    "S3ObjectKey": "source.zip",
                 },
-                "stages": [
-                    {
-                        "name": "Source",
-                        "actions": [
-                            {
-                                "name": "SourceAction",
-                                "actionTypeId": {
-                                    "category": "Source",
-                                    "owner": "AWS",
-                                    "provider": "S3",
-                                    "version": "1",
-                                },
-                                "configuration": {
-                                    "S3Bucket": mock_s3_bucket,
-                                    "S3ObjectKey": "source.zip",
-                                },
-                                "outputArtifacts": [{"name": "SourceOutput"}],
-                                # Additional parameters can be added here
-                            }
-                        ],
-                    },
-                    # Pipelines must have >1 stage, so we add a second copy of the source stage
-                    # to get around this limitation.
-                    {
-                        "name": "Source",
-                        "actions": [
-                            {
-                                "name": "SourceAction",
-                                "actionTypeId": {
-                                    "category": "Source",
-                                    "owner": "AWS",
-                                    "provider": "S3",
-                                    "version": "1",
-                                },
-                                "configuration": {
-                                    "S3Bucket": mock_s3_bucket,
-                                    "S3ObjectKey": "source.zip",
-                                },
-                                "outputArtifacts": [{"name": "SourceOutput"}],
-                                # Additional parameters can be added here
-                            }
-                        ],
-                    },
-                ],
+                "outputArtifacts": [{"name": "SourceOutput"}],
+                # Additional parameters can be added here
             }
-        )
-
-        yield result["pipeline"]["name"]
-
-
-@pytest.fixture
-def mock_codebuild_project(aws_credentials, mock_assumable_role):
-    with mock_aws():
-        iam_client: IAMClient = boto3.client("iam")
-        codebuild_client: CodeBuildClient = boto3.client("codebuild")
-
-        iam_role = iam_client.create_role(
-            RoleName="unit-test-codebuild-role",
-            AssumeRolePolicyDocument=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Service": "codebuild.amazonaws.com"},
-                            "Action": "sts:AssumeRole",
-                        }
-                    ],
-                }
-            ),
-        )
-
-        result = codebuild_client.create_project(
-            name="unit-test-project",
-            source={
+        ],
+    }
+    result = codepipeline_client.create_pipeline(
+        pipeline={
+            "name": "unit-test-pipeline",
+            "roleArn": mock_service_roles["codepipeline"],
+            "artifactStore": {
                 "type": "S3",
-                "location": "s3://unit-test-bucket/source.zip",
-            },
-            serviceRole=iam_role["Role"]["Arn"],
-            artifacts={
-                "type": "NO_ARTIFACTS",
+                "location": mock_s3_bucket,
             },
-            environment={
-                "type": "LINUX_CONTAINER",
-                "image": "aws/codebuild/standard:5.0",
-                "computeType": "BUILD_GENERAL1_SMALL",
-            },
-        )
-
-        yield result["project"]["name"]
+            # Pipelines must have >1 stage, so the source stage is listed twice
+            # to get around this limitation.
+            "stages": [source_stage, source_stage],
+        }
+    )
+
+    yield result["pipeline"]["name"]
+
+
+@pytest.fixture(scope="session")
+def mock_codebuild_project(boto3_session, mock_service_roles, mock_assumable_role):
+    codebuild_client: CodeBuildClient = boto3_session.client("codebuild")
+
+    result = codebuild_client.create_project(
+        name="unit-test-project",
+        source={
+            "type": "S3",
+            "location": "s3://unit-test-bucket/source.zip",
+        },
+        serviceRole=mock_service_roles["codebuild"],
+        artifacts={
+            "type": "NO_ARTIFACTS",
+        },
+        environment={
+            "type": "LINUX_CONTAINER",
+            "image": "aws/codebuild/standard:5.0",
+            "computeType": "BUILD_GENERAL1_SMALL",
+        },
+    )
+
+    yield result["project"]["name"]
@@ -1,6 +1,6 @@
 import logging
 import sys
-from contextlib import ExitStack as does_not_raise
+from contextlib import nullcontext as does_not_raise
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,43 +14,51 @@ from launch_webhook_aws.destination import (
     CodeBuild,
     CodePipeline,
     LambdaFunction,
+    clear_caches,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_destination_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
 @pytest.mark.parametrize(
     "input, expected, raises",
     [
         (None, b"", does_not_raise()),
         ("string", b"string", does_not_raise()),
         (b"bytes", b"bytes", does_not_raise()),
-        ({"foo": "bar"}, b'{"foo": "bar"}', does_not_raise()),
-        ([1, 2, 3], b"[1, 2, 3]", does_not_raise()),
+        ({"foo": "bar"}, b'{"foo":"bar"}', does_not_raise()),
+        ([1, 2, 3], b"[1,2,3]", does_not_raise()),
         (123, None, pytest.raises(ValueError)),
         (123.45, None, pytest.raises(ValueError)),
     ],
 )
 def test_convert_lambda_payload(input, expected, raises):
     with raises:
-        LambdaFunction.convert_lambda_payload(input) == expected
+        assert LambdaFunction.convert_lambda_payload(input) == expected
 
 
 def test_assumed_role_credentials_do_not_log(caplog, capsys):
     """
-    Use of the SecretStr type in AssumedRoleCredentials should prevent the
-    credentials from leaking into logs or stdout.
+    AssumedRoleCredentials excludes its fields from its repr, which should
+    prevent the credentials from leaking into logs or stdout.
     """
 
     creds = AssumedRoleCredentials(
-        AccessKeyId="hunter2",
-        SecretAccessKey="hunter2",  # pragma: allowlist secret
-        SessionToken="hunter2",
+        aws_access_key_id="hunter2",
+        aws_secret_access_key="hunter2",  # pragma: allowlist secret
+        aws_session_token="hunter2",
     )
 
     logger = logging.getLogger("unit-test")
 
     with caplog.at_level(logging.DEBUG):
         logger.debug(creds)
-        # logger.debug(creds.model_dump())
+        # logger.debug(creds.aws_secret_access_key)
 
     print("Nothing sensitive here.")
     print(f"My creds are: {creds}")
@@ -64,34 +72,19 @@ def test_assumed_role_credentials_do_not_log(caplog, capsys):
     assert "hunter2" not in caplog.text
 
 
-class MockStsClient(MagicMock):
-    @property
-    def __class__(self):
-        return StsClient
-
-
-class MockCodeBuildClient(MagicMock):
-    @property
-    def __class__(self):
-        return CodeBuildClient
+def make_client(client_type: type) -> MagicMock:
+    """Builds a mock that passes isinstance checks against a boto3 client type.
 
-
-class MockCodePipelineClient(MagicMock):
-    @property
-    def __class__(self):
-        return CodePipelineClient
-
-
-class MockLambdaClient(MagicMock):
-    @property
-    def __class__(self):
-        return LambdaClient
+    Binding the mock to the client's spec also makes getting or setting anything
+    the real client doesn't have fail loudly.
+    """
+    return MagicMock(spec_set=client_type)
 
 
 class TestInvokeOverridesClassValuesWithEventValues:
     def test_codebuild(self):
-        sts_client = MockStsClient()
-        service_client = MockCodeBuildClient()
+        sts_client = make_client(StsClient)
+        service_client = make_client(CodeBuildClient)
 
         codebuild = CodeBuild(
             type="codebuild",
@@ -117,8 +110,8 @@ class TestInvokeOverridesClassValuesWithEventValues:
         )
 
     def test_codepipeline(self):
-        sts_client = MockStsClient()
-        service_client = MockCodePipelineClient()
+        sts_client = make_client(StsClient)
+        service_client = make_client(CodePipelineClient)
 
         codepipeline = CodePipeline(
             type="codepipeline",
@@ -149,8 +142,8 @@ class TestInvokeOverridesClassValuesWithEventValues:
         )
 
     def test_lambda_function(self):
-        sts_client = MockStsClient()
-        service_client = MockLambdaClient()
+        sts_client = make_client(StsClient)
+        service_client = make_client(LambdaClient)
 
         lambda_function = LambdaFunction(
             type="lambdafunction",
@@ -178,7 +171,7 @@ class TestInvokeOverridesClassValuesWithEventValues:
 class TestRoleAssumptionBehavior:
     def test_role_assumption_passes_model_values(self, mocker):
         mocked_boto3 = mocker.patch("launch_webhook_aws.destination.boto3")
-        sts_client = MockStsClient()
+        sts_client = make_client(StsClient)
         cred_response = {
             "Credentials": {
                 "AccessKeyId": "foo",
@@ -211,12 +204,14 @@ class TestRoleAssumptionBehavior:
         mocked_boto3.client.assert_called_once_with(
             "lambda",
             region_name="us-west-2",
-            **AssumedRoleCredentials(**cred_response["Credentials"]).model_dump(),
+            aws_access_key_id="foo",
+            aws_secret_access_key="bar",  # pragma: allowlist secret
+            aws_session_token="baz",
         )
 
     def test_unset_region_is_not_passed(self, mocker):
         mocked_boto3 = mocker.patch("launch_webhook_aws.destination.boto3")
-        sts_client = MockStsClient()
+        sts_client = make_client(StsClient)
         cred_response = {
             "Credentials": {
                 "AccessKeyId": "foo",
@@ -247,5 +242,121 @@ class TestRoleAssumptionBehavior:
 
         mocked_boto3.client.assert_called_once_with(
             "lambda",
-            **AssumedRoleCredentials(**cred_response["Credentials"]).model_dump(),
+            aws_access_key_id="foo",
+            aws_secret_access_key="bar",  # pragma: allowlist secret
+            aws_session_token="baz",
+        )
+
+    def test_clients_are_reused_for_the_same_credentials(self, mocker):
+        mocked_boto3 = mocker.patch("launch_webhook_aws.destination.boto3")
+        sts_client = make_client(StsClient)
+        sts_client.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "foo",
+                "SecretAccessKey": "bar",  # pragma: allowlist secret
+                "SessionToken": "baz",
+            }
+        }
+
+        lambda_functions = [
+            LambdaFunction(
+                type="lambdafunction",
+                role_arn="arn:aws:iam::123456789012:role/example-role",
+                function_name=function_name,
+                sts_client=sts_client,
+            )
+            for function_name in ("first-function", "second-function")
+        ]
+
+        for lambda_function in lambda_functions:
+            lambda_function.assume_role()
+
+        mocked_boto3.client.assert_called_once()
+        assert lambda_functions[0].client is lambda_functions[1].client
+
+    def test_credentials_are_reused_for_the_same_role(self, mocker):
+        mocker.patch("launch_webhook_aws.destination.boto3")
+        sts_client = make_client(StsClient)
+        sts_client.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "foo",
+                "SecretAccessKey": "bar",  # pragma: allowlist secret
+                "SessionToken": "baz",
+            }
+        }
+
+        codebuild = CodeBuild(
+            type="codebuild",
+            role_arn="arn:aws:iam::123456789012:role/example-role",
+            project_name="cool-project",
+            sts_client=sts_client,
+        )
+        lambda_function = LambdaFunction(
+            type="lambdafunction",
+            role_arn="arn:aws:iam::123456789012:role/example-role",
+            function_name="my-lambda-function",
+            sts_client=sts_client,
+        )
+
+        codebuild.assume_role()
+        lambda_function.assume_role()
+
+        sts_client.assume_role.assert_called_once()
+
+    def test_expiring_credentials_are_refreshed(self, mocker):
+        mocker.patch("launch_webhook_aws.destination.boto3")
+        mocked_time = mocker.patch("launch_webhook_aws.destination.time")
+        sts_client = make_client(StsClient)
+        sts_client.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "foo",
+                "SecretAccessKey": "bar",  # pragma: allowlist secret
+                "SessionToken": "baz",
+            }
+        }
+
+        for now in (0, 900):
+            mocked_time.monotonic.return_value = now
+            LambdaFunction(
+                type="lambdafunction",
+                role_arn="arn:aws:iam::123456789012:role/example-role",
+                function_name="my-lambda-function",
+                sts_client=sts_client,
+            ).assume_role()
+
+        assert sts_client.assume_role.call_count == 2
+
+    def test_client_is_rebuilt_when_credentials_are_refreshed(self, mocker):
+        mocked_boto3 = mocker.patch("launch_webhook_aws.destination.boto3")
+        mocked_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mocked_time = mocker.patch("launch_webhook_aws.destination.time")
+        sts_client = make_client(StsClient)
+        sts_client.assume_role.side_effect = [
+            {
+                "Credentials": {
+                    "AccessKeyId": "foo",
+                    "SecretAccessKey": "bar",  # pragma: allowlist secret
+                    "SessionToken": session_token,
+                }
+            }
+            for session_token in ("first-token", "second-token")
+        ]
+        lambda_function = LambdaFunction(
+            type="lambdafunction",
+            role_arn="arn:aws:iam::123456789012:role/example-role",
+            function_name="my-lambda-function",
+            sts_client=sts_client,
+        )
+
+        clients = []
+        for now in (0, 10, 900):
+            mocked_time.monotonic.return_value = now
+            lambda_function.assume_role()
+            clients.append(lambda_function.client)
+
+        assert sts_client.assume_role.call_count == 2
+        assert clients[0] is clients[1]
+        assert clients[2] is not clients[1]
+        assert (
+            mocked_boto3.client.call_args.kwargs["aws_session_token"] == "second-token"
         )
@@ -1,5 +1,8 @@
 import json
+import os
 import pathlib
+import subprocess
+import sys
 
 import pytest
 from pydantic import ValidationError
@@ -8,49 +11,32 @@ from launch_webhook_aws.bitbucket_server import event as bitbucket_server_event
 from launch_webhook_aws.github import event as github_event
 from launch_webhook_aws.source import SourceEvent
 
+GITHUB_HEADERS = {
+    "X-Github-Hook-Id": "unit-test",
+    "X-Github-Delivery": "unit-test",
+    "X-Hub-Signature": "unit-test",
+    "X-Hub-Signature-256": "unit-test",
+}
 
-class TestBitbucketServerEventsDiscriminate:
-    def test_pr_merged(self, test_event):
-        headers, body = test_event("bitbucket_server", "pr_merged.json")
-        source_event = SourceEvent(headers=headers, body=json.loads(body))
-        transformed_event = source_event.to_source_event()
-        assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
-        )
-        assert isinstance(
-            transformed_event.event, bitbucket_server_event.PullRequestMerged
-        )
-
-    def test_pr_open(self, test_event):
-        headers, body = test_event("bitbucket_server", "pr_open.json")
-        source_event = SourceEvent(headers=headers, body=json.loads(body))
-        transformed_event = source_event.to_source_event()
-        assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
-        )
-        assert isinstance(
-            transformed_event.event, bitbucket_server_event.PullRequestOpened
-        )
-
-    def test_source_updated(self, test_event):
-        headers, body = test_event("bitbucket_server", "pr_source_updated.json")
-        source_event = SourceEvent(headers=headers, body=json.loads(body))
-        transformed_event = source_event.to_source_event()
-        assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
-        )
-        assert isinstance(
-            transformed_event.event, bitbucket_server_event.SourceBranchUpdated
-        )
 
-    def test_push(self, test_event):
-        headers, body = test_event("bitbucket_server", "push.json")
+class TestBitbucketServerEventsDiscriminate:
+    @pytest.mark.parametrize(
+        "file_name, event_type",
+        [
+            ("pr_merged.json", bitbucket_server_event.PullRequestMerged),
+            ("pr_open.json", bitbucket_server_event.PullRequestOpened),
+            ("pr_source_updated.json", bitbucket_server_event.SourceBranchUpdated),
+            ("push.json", bitbucket_server_event.Push),
+        ],
+    )
+    def test_event(self, test_event, file_name, event_type):
+        headers, body = test_event("bitbucket_server", file_name)
         source_event = SourceEvent(headers=headers, body=json.loads(body))
         transformed_event = source_event.to_source_event()
         assert isinstance(
             transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
         )
-        assert isinstance(transformed_event.event, bitbucket_server_event.Push)
+        assert isinstance(transformed_event.event, event_type)
 
     def test_bitbucket_cloud_headers_fails_to_discriminate(self, test_event):
         """
@@ -68,76 +54,27 @@ class TestBitbucketServerEventsDiscriminate:
 
 
 class TestGithubEventsDiscriminate:
-    def test_ping(self, test_json):
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "ping",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-
-        body = test_json(pathlib.Path("test/data/events/github/ping.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_event.GithubWebhookEvent)
-        assert isinstance(transformed_event.event, github_event.Ping)
-
-    def test_push(self, test_json):
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "push",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/push.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_event.GithubWebhookEvent)
-        assert isinstance(transformed_event.event, github_event.Push)
-
-    def test_pr_open(self, test_json):
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_event.GithubWebhookEvent)
-        assert isinstance(transformed_event.event, github_event.PullRequestOpened)
-
-    def test_pr_merged(self, test_json):
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_merged.json"))
+    @pytest.mark.parametrize(
+        "file_name, header_event, event_type",
+        [
+            ("ping.json", "ping", github_event.Ping),
+            ("push.json", "push", github_event.Push),
+            ("pr_open.json", "pull_request", github_event.PullRequestOpened),
+            ("pr_merged.json", "pull_request", github_event.PullRequestClosed),
+            (
+                "pr_source_updated.json",
+                "pull_request",
+                github_event.PullRequestSynchronize,
+            ),
+        ],
+    )
+    def test_event(self, test_json, file_name, header_event, event_type):
+        headers = {**GITHUB_HEADERS, "X-Github-Event": header_event}
+        body = test_json(pathlib.Path(f"test/data/events/github/{file_name}"))
         source_event = SourceEvent(headers=headers, body=body)
         transformed_event = source_event.to_source_event()
         assert isinstance(transformed_event, github_event.GithubWebhookEvent)
-        assert isinstance(transformed_event.event, github_event.PullRequestClosed)
-
-    def test_pr_source_updated(self, test_json):
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_source_updated.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_event.GithubWebhookEvent)
-        assert isinstance(transformed_event.event, github_event.PullRequestSynchronize)
+        assert isinstance(transformed_event.event, event_type)
 
 
 def test_unrecognized_headers_fail_source_event_discrimination():
@@ -150,3 +87,36 @@ def test_unrecognized_headers_fail_source_event_discrimination():
     body = {}
     with pytest.raises(ValueError, match="Failed to discriminate header source"):
         _ = SourceEvent(headers=headers, body=body)
+
+
+def test_unrecognized_github_event_fails_validation(test_json):
+    headers = {**GITHUB_HEADERS, "X-Github-Event": "issues"}
+    body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
+    source_event = SourceEvent(headers=headers, body=body)
+    with pytest.raises(ValidationError):
+        source_event.to_source_event()
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_raw_json_body_is_parsed(test_event, encode):
+    headers, body = test_event("bitbucket_server", "push.json")
+    if encode:
+        body = body.encode("utf-8")
+    source_event = SourceEvent(headers=headers, body=body)
+    assert source_event.body == json.loads(body)
+    assert isinstance(source_event.to_source_event().event, bitbucket_server_event.Push)
+
+
+def test_event_models_import_without_warnings():
+    # Run in a fresh interpreter, as the models are already imported here.
+    subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "error",
+            "-c",
+            "import launch_webhook_aws.github.event, launch_webhook_aws.bitbucket_server.event",
+        ],
+        check=True,
+        env={**os.environ, "PYTHONPATH": "src"},
+    )
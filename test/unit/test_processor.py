@@ -1,19 +1,58 @@
 import json
 import logging
 import pathlib
-from contextlib import ExitStack as does_not_raise
+from contextlib import nullcontext as does_not_raise
 
-from moto import mock_aws
+import pytest
+from pydantic import ValidationError
 
 from launch_webhook_aws.bitbucket_server.event import PullRequestMerged
-from launch_webhook_aws.github.event import PullRequestClosed
+from launch_webhook_aws.github.event import (
+    GithubWebhookEvent,
+    PullRequestClosed,
+    PullRequestOpened,
+)
+from launch_webhook_aws.github.type import Repository
 from launch_webhook_aws.processor import EventProcessor
+from launch_webhook_aws.rule import Rule
+from launch_webhook_aws.source import GithubSource
+
+RULES_DIR = pathlib.Path("test/data/rules")
+EXAMPLE_RULES = RULES_DIR / "example_rules.json"
+SIMPLE_CODEBUILD_RULES = RULES_DIR / "simple_codebuild.json"
+SIMPLE_CODEPIPELINE_RULES = RULES_DIR / "simple_codepipeline.json"
+SIMPLE_LAMBDAFUNCTION_RULES = RULES_DIR / "simple_lambdafunction.json"
+
+
+@pytest.fixture(scope="class")
+def example_processor():
+    contents = EXAMPLE_RULES.read_text()
+    return EventProcessor(rules=json.loads(contents))
+
+
+@pytest.fixture(scope="class")
+def signed_lambda_processor(
+    mock_secretsmanager_secret, mock_assumable_role, mock_lambda_function
+):
+    """A Lambda rule that verifies signatures, built once for the tests sharing it."""
+    contents = SIMPLE_LAMBDAFUNCTION_RULES.read_text()
+    rules = json.loads(contents)
+    rules[0]["source"]["verify_signature"] = True
+    rules[0]["source"]["signature_secret"] = mock_secretsmanager_secret
+    rules[0]["destination"]["role_arn"] = mock_assumable_role
+    rules[0]["destination"]["function_name"] = mock_lambda_function
+    return EventProcessor(rules=rules)
+
+
+class StubCodePipelineDestination:
+    def invoke(self, transformed_event: dict) -> dict:
+        return {"pipelineExecutionId": "unit-test"}
 
 
 class TestProcessorInstantiation:
     def test_instantiates_with_no_rules(self):
         processor = EventProcessor(rules=[])
-        assert processor.rules == []
+        assert processor.rules == ()
 
     def test_instantiates_with_rules(self):
         def example_github_transform(event: PullRequestClosed) -> dict:
@@ -56,17 +95,79 @@ class TestProcessorInstantiation:
         processor = EventProcessor(rules=rules)
         assert len(processor.rules) == 2
 
-    def test_load_rules_from_json(self):
-        contents = pathlib.Path("test/data/rules/example_rules.json").read_text()
+    def test_load_rules_from_json(self, example_processor):
+        assert len(example_processor.rules) == 2
+
+
+def github_rule(organization: str = "example-org", **overrides) -> dict:
+    return {
+        "source": {
+            "type": "github",
+            "organization": organization,
+            "events": ["pull_request.closed"],
+        },
+        "destination": {"type": "none"},
+        **overrides,
+    }
+
+
+class TestProcessorRuleDispatch:
+    def test_events_reach_only_subscribed_rules(self, test_event, mocker):
+        contents = EXAMPLE_RULES.read_text()
         processor = EventProcessor(rules=json.loads(contents))
-        assert len(processor.rules) == 2
+        for rule in processor.rules:
+            rule.destination = mocker.MagicMock()
+        github_subscriber, bitbucket_subscriber = processor.rules
+        headers, body = test_event("github", "pr_merged.json")
+
+        processor.process_raw_event(headers=headers, body=body)
+        github_subscriber.destination.invoke.assert_called_once()
+        bitbucket_subscriber.destination.invoke.assert_not_called()
+
+    def test_repeated_events_dispatch_once(self, test_event, mocker):
+        transformed = []
 
+        def counting_transform(event: dict) -> dict:
+            transformed.append(event)
+            return {}
 
-@mock_aws
+        rule = github_rule(transform=counting_transform)
+        rule["source"]["events"] = ["pull_request.closed", "pull_request.closed"]
+        processor = EventProcessor(rules=[rule])
+        processor.rules[0].destination = mocker.MagicMock()
+        headers, body = test_event("github", "pr_merged.json")
+
+        processor.process_raw_event(headers=headers, body=body)
+        assert len(transformed) == 1
+        processor.rules[0].destination.invoke.assert_called_once_with(
+            transformed_event={}
+        )
+
+    def test_assigned_rules_are_dispatched(self, test_event, mocker):
+        processor = EventProcessor(rules=[github_rule(organization="foo")])
+        rule = Rule(**github_rule())
+        rule.destination = mocker.MagicMock()
+        headers, body = test_event("github", "pr_merged.json")
+
+        processor.process_raw_event(headers=headers, body=body)
+        rule.destination.invoke.assert_not_called()
+
+        processor.rules = (*processor.rules, rule)
+        processor.process_raw_event(headers=headers, body=body)
+        rule.destination.invoke.assert_called_once()
+
+    def test_rules_cannot_change_in_place(self):
+        processor = EventProcessor(rules=[github_rule(organization="foo")])
+        assert isinstance(processor.rules, tuple)
+        with pytest.raises(ValidationError):
+            processor.rules[0].source = GithubSource(**github_rule()["source"])
+
+
+@pytest.mark.aws
+@pytest.mark.usefixtures("mock_aws_session")
 class TestProcessorRuleMatching:
-    def test_match_happy_path(self, test_event):
-        contents = pathlib.Path("test/data/rules/example_rules.json").read_text()
-        processor = EventProcessor(rules=json.loads(contents))
+    def test_match_happy_path(self, test_event, example_processor):
+        processor = example_processor
         assert len(processor.rules) == 2
         headers, body = test_event("github", "pr_merged.json")
 
@@ -78,25 +179,30 @@ class TestProcessorRuleMatching:
         with does_not_raise():
             processor.process_raw_event(headers=headers, body=body)
 
-    def test_event_not_matched(self, test_event, caplog):
-        contents = pathlib.Path("test/data/rules/example_rules.json").read_text()
-        processor = EventProcessor(rules=json.loads(contents))
+    def test_event_not_matched(self, caplog, example_processor):
+        processor = example_processor
         assert len(processor.rules) == 2
-        headers, body = test_event("github", "pr_open.json")
-
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                # The Github rule is set for pr_closed and should not match the pr_open event
-                assert (
-                    "Event action mismatch: pull_request.opened not in ['pull_request.closed']"
-                    in caplog.text
-                )
-                # The Bitbucket rule should not match the Github event
-                assert (
-                    "Event source mismatch: <class 'launch_webhook_aws.github.event.PullRequestOpened'> is not a BitbucketServerEvent"
-                    in caplog.text
-                )
+        # Only the fields rule lookup reads are needed, so the event is built
+        # without validating a full payload.
+        source_event = GithubWebhookEvent.model_construct(
+            event=PullRequestOpened.model_construct(
+                action="opened",
+                repository=Repository.model_construct(
+                    full_name="example-org/example-repo", name="example-repo"
+                ),
+            )
+        )
+
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_event(source_event, raw_event_body=b"{}")
+            # The Github rule is set for pr_closed and the Bitbucket rule for
+            # Bitbucket events, so neither is a candidate for the pr_open event
+            assert (
+                "No rules subscribe to pull_request.opened events from example-org"
+                in caplog.text
+            )
+            assert "Transforming event" not in caplog.text
 
     # def test_one_event_matching_multiple_rules(
     #     self, test_event, caplog, mock_rules_from_file
@@ -116,81 +222,80 @@ class TestProcessorRuleMatching:
     #             breakpoint()
 
 
-@mock_aws
+@pytest.mark.aws
+@pytest.mark.usefixtures("mock_aws_session")
 class TestProcessorEventSignatureValidation:
-    def test_valid_signature(
-        self,
-        test_event,
-        caplog,
-        mock_secretsmanager_secret,
-        mock_lambda_function,
-        mock_assumable_role,
-    ):
-        contents = pathlib.Path(
-            "test/data/rules/simple_lambdafunction.json"
-        ).read_text()
-        processor = EventProcessor(rules=json.loads(contents))
-        processor.rules[0].source.verify_signature = True
-        processor.rules[0].source.signature_secret = mock_secretsmanager_secret
-        processor.rules[0].destination.role_arn = mock_assumable_role
-        processor.rules[0].destination.function_name = mock_lambda_function
+    def test_valid_signature(self, test_event, caplog, signed_lambda_processor):
+        processor = signed_lambda_processor
         headers, body = test_event("github", "pr_merged.json")
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert "Invoked destination successfully" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert "Invoked destination successfully" in caplog.text
 
-    def test_invalid_signature(self, test_event, caplog, mock_secretsmanager_secret):
-        contents = pathlib.Path(
-            "test/data/rules/simple_lambdafunction.json"
-        ).read_text()
-        processor = EventProcessor(rules=json.loads(contents))
-        processor.rules[0].source.verify_signature = True
-        processor.rules[0].source.signature_secret = mock_secretsmanager_secret
+    def test_valid_signature_bytes_body(
+        self, test_event, caplog, signed_lambda_processor
+    ):
+        processor = signed_lambda_processor
+        headers, body = test_event("github", "pr_merged.json")
+
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body.encode("utf-8"))
+            assert "Invoked destination successfully" in caplog.text
+
+    @pytest.mark.parametrize(
+        "signature", ["invalid_signature", "sha256=not-hex", "sha1=abcdef"]
+    )
+    def test_invalid_signature(
+        self, test_event, caplog, signed_lambda_processor, signature
+    ):
+        processor = signed_lambda_processor
         headers, body = test_event("github", "pr_merged.json")
-        headers["X-Hub-Signature-256"] = "invalid_signature"
+        headers["X-Hub-Signature-256"] = signature
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert (
-                    "Signature verification failed for event_signature='invalid_signature'"
-                    in caplog.text
-                )
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert (
+                f"Signature verification failed for event_signature='{signature}'"
+                in caplog.text
+            )
+            assert "Calculated signature" not in caplog.text
 
     def test_missing_signature_secret(self, test_event, caplog):
-        contents = pathlib.Path(
-            "test/data/rules/simple_lambdafunction.json"
-        ).read_text()
-        processor = EventProcessor(rules=json.loads(contents))
-        processor.rules[0].source.verify_signature = True
-        processor.rules[0].source.signature_secret = (
+        contents = SIMPLE_LAMBDAFUNCTION_RULES.read_text()
+        rules = json.loads(contents)
+        rules[0]["source"]["verify_signature"] = True
+        rules[0]["source"]["signature_secret"] = (
             "arn:aws:secretsmanager:us-east-1:123456789012:secret:does-not-exist"
         )
+        processor = EventProcessor(rules=rules)
         headers, body = test_event("github", "pr_merged.json")
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert "Failure while verifying event signature" in caplog.text
-                assert "Secrets Manager can't find the specified secret" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert "Failure while verifying event signature" in caplog.text
+            assert "Secrets Manager can't find the specified secret" in caplog.text
 
 
+@pytest.mark.aws
 class TestProcessorDestinationInvocation:
     def test_codebuild_invocation(
         self, caplog, test_event, mock_assumable_role, mock_codebuild_project
     ):
-        contents = pathlib.Path("test/data/rules/simple_codebuild.json").read_text()
+        contents = SIMPLE_CODEBUILD_RULES.read_text()
         processor = EventProcessor(rules=json.loads(contents))
         processor.rules[0].destination.role_arn = mock_assumable_role
         processor.rules[0].destination.project_name = mock_codebuild_project
         headers, body = test_event("github", "pr_merged.json")
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert "Invoked destination successfully" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert "Invoked destination successfully" in caplog.text
 
     def test_codepipeline_invocation(
         self,
@@ -198,9 +303,8 @@ class TestProcessorDestinationInvocation:
         test_event,
         mock_assumable_role,
         mock_codepipeline_pipeline,
-        mocker,
     ):
-        contents = pathlib.Path("test/data/rules/simple_codepipeline.json").read_text()
+        contents = SIMPLE_CODEPIPELINE_RULES.read_text()
         processor = EventProcessor(rules=json.loads(contents))
         processor.rules[0].destination.role_arn = mock_assumable_role
         processor.rules[0].destination.pipeline_name = mock_codepipeline_pipeline
@@ -208,28 +312,60 @@ class TestProcessorDestinationInvocation:
 
         # moto doesn't have full support for invoking a CodePipeline so this is mocked for now
         # TODO: look into https://docs.getmoto.org/en/latest/docs/services/patching_other_services.html
-        processor.rules[0].destination = mocker.MagicMock()
-        processor.rules[0].destination.invoke.return_value = {
-            "pipelineExecutionId": "unit-test"
-        }
+        processor.rules[0].destination = StubCodePipelineDestination()
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert "Invoked destination successfully" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert "Invoked destination successfully" in caplog.text
 
     def test_lambda_invocation(
         self, caplog, test_event, mock_assumable_role, mock_lambda_function
     ):
-        contents = pathlib.Path(
-            "test/data/rules/simple_lambdafunction.json"
-        ).read_text()
+        contents = SIMPLE_LAMBDAFUNCTION_RULES.read_text()
         processor = EventProcessor(rules=json.loads(contents))
         processor.rules[0].destination.role_arn = mock_assumable_role
         processor.rules[0].destination.function_name = mock_lambda_function
         headers, body = test_event("github", "pr_merged.json")
 
-        with caplog.at_level(logging.DEBUG):
-            with does_not_raise():
-                processor.process_raw_event(headers=headers, body=body)
-                assert "Invoked destination successfully" in caplog.text
+        caplog.set_level(logging.DEBUG, logger="processor")
+        with does_not_raise():
+            processor.process_raw_event(headers=headers, body=body)
+            assert "Invoked destination successfully" in caplog.text
+
+
+class TestProcessorSecretCache:
+    SECRET_ARN = "arn:aws:secretsmanager:us-east-1:123456789012:secret:unit-test"
+
+    def test_secret_is_fetched_once_within_ttl(self, mocker):
+        secretsmanager_client = mocker.MagicMock()
+        secretsmanager_client.get_secret_value.return_value = {
+            "SecretString": "hunter2"  # pragma: allowlist secret
+        }
+        processor = EventProcessor(
+            rules=[], secretsmanager_client=secretsmanager_client
+        )
+
+        assert processor.get_signature_secret(self.SECRET_ARN) == b"hunter2"
+        assert processor.get_signature_secret(self.SECRET_ARN) == b"hunter2"
+        secretsmanager_client.get_secret_value.assert_called_once_with(
+            SecretId=self.SECRET_ARN
+        )
+
+    def test_secret_is_refetched_after_ttl(self, mocker):
+        mocked_time = mocker.patch("launch_webhook_aws.processor.time")
+        secretsmanager_client = mocker.MagicMock()
+        secretsmanager_client.get_secret_value.return_value = {
+            "SecretString": "hunter2"  # pragma: allowlist secret
+        }
+        processor = EventProcessor(
+            rules=[],
+            secretsmanager_client=secretsmanager_client,
+            secret_cache_ttl_seconds=300,
+        )
+
+        for now in (0, 300):
+            mocked_time.monotonic.return_value = now
+            processor.get_signature_secret(self.SECRET_ARN)
+
+        assert secretsmanager_client.get_secret_value.call_count == 2
@@ -1,11 +1,11 @@
-from contextlib import ExitStack as does_not_raise
+from contextlib import nullcontext as does_not_raise
 from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
 from launch_webhook_aws.github.event import PullRequestClosed
-from launch_webhook_aws.rule import Rule
+from launch_webhook_aws.rule import Rule, import_transform, inspect_transform
 from launch_webhook_aws.transform import TransformResult
 
 
@@ -19,6 +19,9 @@ class ExampleTransforms:
     @staticmethod
     def generic_dictionary_is_fine(event: dict[str, Any]) -> dict[str, Any]: ...
 
+    @staticmethod
+    def union_arg_is_rejected(event: PullRequestClosed | None) -> dict: ...
+
     @staticmethod
     def generic_arg_aliases_are_inspected(event: list[str]) -> dict: ...
 
@@ -54,6 +57,7 @@ class ExampleTransforms:
         (ExampleTransforms.good, does_not_raise()),
         (ExampleTransforms.also_good, does_not_raise()),
         (ExampleTransforms.generic_dictionary_is_fine, does_not_raise()),
+        (ExampleTransforms.union_arg_is_rejected, pytest.raises(ValidationError)),
         (
             ExampleTransforms.generic_arg_aliases_are_inspected,
             pytest.raises(ValidationError),
@@ -92,6 +96,47 @@ def test_rule_transform_type_checking(transform, raises):
         )
 
 
+@pytest.mark.parametrize(
+    "transform, takes_dict",
+    [
+        (ExampleTransforms.good, True),
+        (ExampleTransforms.also_good, False),
+        (ExampleTransforms.generic_dictionary_is_fine, True),
+    ],
+)
+def test_rule_records_transform_event_type(transform, takes_dict):
+    rule = Rule(
+        source={
+            "type": "github",
+            "organization": "example-org",
+            "events": ["pull_request.closed"],
+        },
+        transform=transform,
+        destination={
+            "type": "lambdafunction",
+            "function_name": "example-function",
+            "role_arn": "arn:aws:iam::123456789012:role/example-role",
+        },
+    )
+    assert rule.transform_takes_dict is takes_dict
+
+
+def test_transform_inspection_is_cached():
+    inspect_transform.cache_clear()
+    for _ in range(2):
+        Rule(
+            source={
+                "type": "github",
+                "organization": "example-org",
+                "events": ["pull_request.closed"],
+            },
+            transform=ExampleTransforms.good,
+            destination={"type": "none"},
+        )
+    assert inspect_transform.cache_info().misses == 1
+    assert inspect_transform.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "target, raises",
     [
@@ -142,6 +187,25 @@ def test_transform_provided_as_string(target, raises):
         )
 
 
+def test_transform_import_is_cached():
+    import_transform.cache_clear()
+    rules = [
+        Rule(
+            source={
+                "type": "github",
+                "organization": "example-org",
+                "events": ["pull_request.closed"],
+            },
+            transform="test.example_library.sample_transform_function",
+            destination={"type": "none"},
+        )
+        for _ in range(2)
+    ]
+    assert rules[0].transform is rules[1].transform
+    assert import_transform.cache_info().misses == 1
+    assert import_transform.cache_info().hits == 1
+
+
 def test_transform_string_not_importable(mocker):
     mocker.patch("importlib.import_module", side_effect=ImportError)
     with pytest.raises(
@@ -1,5 +1,7 @@
 import pathlib
-from contextlib import ExitStack as does_not_raise
+from contextlib import nullcontext as does_not_raise
+
+from pydantic import BaseModel
 
 from launch_webhook_aws.bitbucket_server import event as bitbucket_server_event
 from launch_webhook_aws.github import event as github_event
@@ -50,6 +52,17 @@ class TestBitbucketServerEventsParse:
         with does_not_raise():
             bitbucket_server_event.Push(headers=headers, **body)
 
+    def test_payload_types_are_models(self, test_json):
+        headers = {
+            "X-Request-Id": "unit-test",
+            "X-Event-Key": "pr:opened",
+            "X-Hub-Signature": "unit-test",
+        }
+        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
+        event = bitbucket_server_event.PullRequestOpened(headers=headers, **body)
+        assert isinstance(event.pull_request, BaseModel)
+        assert event.model_dump()["pull_request"]["to_ref"]["repository"]["name"]
+
 
 class TestGithubEventsParse:
     def test_ping(self, test_json):
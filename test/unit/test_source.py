@@ -1,7 +1,7 @@
 import logging
 import pathlib
 import re
-from contextlib import ExitStack as does_not_raise
+from contextlib import nullcontext as does_not_raise
 
 import pytest
 from pydantic import ValidationError
@@ -12,9 +12,41 @@ from launch_webhook_aws.source import (
     BitbucketServerSource,
     GithubSource,
     SourceEvent,
+    combine_patterns,
     validate_patterns,
 )
 
+BITBUCKET_SERVER_PR_OPEN = pathlib.Path(
+    "test/data/events/bitbucket_server/pr_open.json"
+)
+GITHUB_PR_OPEN = pathlib.Path("test/data/events/github/pr_open.json")
+BITBUCKET_SERVER_PR_OPEN_HEADERS = {
+    "X-Request-Id": "unit-test",
+    "X-Event-Key": "pr:opened",
+    "X-Hub-Signature": "unit-test",
+}
+GITHUB_PR_OPEN_HEADERS = {
+    "X-Github-Hook-Id": "unit-test",
+    "X-Github-Event": "pull_request",
+    "X-Github-Delivery": "unit-test",
+    "X-Hub-Signature": "unit-test",
+    "X-Hub-Signature-256": "unit-test",
+}
+
+
+@pytest.fixture(scope="class")
+def bb_transformed_event(test_json):
+    body = test_json(BITBUCKET_SERVER_PR_OPEN)
+    return SourceEvent(
+        headers=BITBUCKET_SERVER_PR_OPEN_HEADERS, body=body
+    ).to_source_event()
+
+
+@pytest.fixture(scope="class")
+def gh_transformed_event(test_json):
+    body = test_json(GITHUB_PR_OPEN)
+    return SourceEvent(headers=GITHUB_PR_OPEN_HEADERS, body=body).to_source_event()
+
 
 @pytest.mark.parametrize(
     "pattern, pattern_raises",
@@ -33,6 +65,35 @@ def test_pattern_validation(pattern, pattern_raises):
         validate_patterns(pattern)
 
 
+def test_repeated_patterns_share_a_compile():
+    assert validate_patterns(["^foo$"])[0] is validate_patterns("^foo$")[0]
+
+
+def test_compiled_patterns_pass_through():
+    pattern = re.compile("^foo$", re.IGNORECASE)
+    assert validate_patterns(pattern)[0] is pattern
+
+
+@pytest.mark.parametrize(
+    "patterns, combined",
+    [
+        ([], None),
+        (["^foo$"], "^foo$"),
+        (["^foo$", "^bar$"], "(?:^foo$)|(?:^bar$)"),
+        ([re.compile("^foo$", re.IGNORECASE), re.compile("^bar$")], None),
+        (["^(a)\\1$", "^bar$"], None),
+        (["(?i)^foo", "(?i)^bar"], None),
+        (["(?x) ^foo", "^bar$"], None),
+    ],
+)
+def test_combine_patterns(patterns, combined):
+    result = combine_patterns(validate_patterns(patterns))
+    if combined is None:
+        assert result is None
+    else:
+        assert result.pattern == combined
+
+
 def test_source_rejects_missing_secret_arn():
     with pytest.raises(ValidationError):
         BitbucketServerSource(
@@ -43,8 +104,49 @@ def test_source_rejects_missing_secret_arn():
         )
 
 
+def test_source_patterns_round_trip_through_json():
+    source = GithubSource(
+        type="github",
+        organization="example-org",
+        events=["pull_request.closed"],
+        include_repositories=["^foo$"],
+    )
+    assert source.model_dump(mode="json")["include_repositories"] == ["^foo$"]
+    assert GithubSource.model_validate_json(source.model_dump_json()) == source
+
+
+def test_source_accepts_inline_flag_patterns(gh_transformed_event):
+    source = GithubSource(
+        type="github",
+        organization="example-org",
+        events=["pull_request.opened"],
+        include_repositories=["(?i)^EXAMPLE-", "(?i)^bar"],
+    )
+    assert source.match(event=gh_transformed_event.event)
+
+
+def test_source_is_frozen():
+    source = GithubSource(
+        type="github", organization="example-org", events=["pull_request.closed"]
+    )
+    with pytest.raises(ValidationError):
+        source.verify_signature = True
+
+
+def test_source_collections_are_immutable():
+    source = GithubSource(
+        type="github",
+        organization="example-org",
+        events=["pull_request.closed"],
+        include_repositories=["^foo$"],
+    )
+    assert isinstance(source.events, tuple)
+    assert isinstance(source.include_repositories, tuple)
+    assert isinstance(source.exclude_repositories, tuple)
+
+
 class TestBitbucketServerSourceMatching:
-    def test_project_key_only(self, test_json):
+    def test_project_key_only(self, bb_transformed_event):
         good_source = BitbucketServerSource(
             type="bitbucket_server", project_key="DSO", events=["pr:opened"]
         )
@@ -52,22 +154,14 @@ class TestBitbucketServerSourceMatching:
             type="bitbucket_server", project_key="foo", events=["pr:opened"]
         )
 
-        headers = {
-            "X-Request-Id": "unit-test",
-            "X-Event-Key": "pr:opened",
-            "X-Hub-Signature": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
         assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
+            bb_transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
         )
 
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
+        assert good_source.match(event=bb_transformed_event.event)
+        assert not bad_source.match(event=bb_transformed_event)
 
-    def test_include_pattern(self, test_json):
+    def test_include_pattern(self, bb_transformed_event):
         good_source = BitbucketServerSource(
             type="bitbucket_server",
             project_key="DSO",
@@ -82,22 +176,14 @@ class TestBitbucketServerSourceMatching:
             include_repositories=["^test-ap{3}$"],
         )
 
-        headers = {
-            "X-Request-Id": "unit-test",
-            "X-Event-Key": "pr:opened",
-            "X-Hub-Signature": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
         assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
+            bb_transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
         )
 
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
+        assert good_source.match(event=bb_transformed_event.event)
+        assert not bad_source.match(event=bb_transformed_event)
 
-    def test_exclude_pattern(self, test_json):
+    def test_exclude_pattern(self, bb_transformed_event):
         good_source = BitbucketServerSource(
             type="bitbucket_server",
             project_key="DSO",
@@ -112,22 +198,14 @@ class TestBitbucketServerSourceMatching:
             include_repositories=["^test-ap{3}$"],
         )
 
-        headers = {
-            "X-Request-Id": "unit-test",
-            "X-Event-Key": "pr:opened",
-            "X-Hub-Signature": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
         assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
+            bb_transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
         )
 
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
+        assert good_source.match(event=bb_transformed_event.event)
+        assert not bad_source.match(event=bb_transformed_event)
 
-    def test_excluded_and_included_pattern(self, test_json):
+    def test_excluded_and_included_pattern(self, bb_transformed_event):
         """
         If a repository matches both an include and an exclude pattern, the exclude pattern should take precedence.
         """
@@ -139,101 +217,86 @@ class TestBitbucketServerSourceMatching:
             exclude_repositories=["^test.+$"],
         )
 
-        headers = {
-            "X-Request-Id": "unit-test",
-            "X-Event-Key": "pr:opened",
-            "X-Hub-Signature": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
         assert isinstance(
-            transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
-        )
-
-        assert not both_patterns.match(event=transformed_event)
-
-    def test_logging(self, test_json, caplog):
-        event_source_mismatch = GithubSource(
-            type="github", organization="DSO", events=["pull_request.opened"]
-        )
-        event_key_mismatch = BitbucketServerSource(
-            type="bitbucket_server", project_key="DSO", events=["pr:merged"]
-        )
-        project_key_mismatch = BitbucketServerSource(
-            type="bitbucket_server", project_key="foo", events=["pr:opened"]
-        )
-        project_key_only = BitbucketServerSource(
-            type="bitbucket_server", project_key="DSO", events=["pr:opened"]
-        )
-        include_match = BitbucketServerSource(
-            type="bitbucket_server",
-            project_key="DSO",
-            events=["pr:opened"],
-            include_repositories=["^test-ap{2}$"],
-        )
-        include_nomatch = BitbucketServerSource(
-            type="bitbucket_server",
-            project_key="DSO",
-            events=["pr:opened"],
-            include_repositories=["^test-ap{3}$"],
-        )
-        exclude_match = BitbucketServerSource(
-            type="bitbucket_server",
-            project_key="DSO",
-            events=["pr:opened"],
-            include_repositories=["^test-ap{2}$"],
-            exclude_repositories=["^test.+$"],
-        )
-
-        headers = {
-            "X-Request-Id": "unit-test",
-            "X-Event-Key": "pr:opened",
-            "X-Hub-Signature": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/bitbucket_server/pr_open.json"))
-
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not event_source_mismatch.match(event=transformed_event.event)
-            assert "Event source mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not event_key_mismatch.match(event=transformed_event.event)
-            assert "Event action mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not project_key_mismatch.match(event=transformed_event.event)
-            assert "Project key mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert project_key_only.match(event=transformed_event.event)
-            assert "No source include patterns defined" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert include_match.match(event=transformed_event.event)
-            assert "matched source include pattern" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not include_nomatch.match(event=transformed_event.event)
-            assert "did not match source include pattern" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not exclude_match.match(event=transformed_event.event)
-            assert "matched source exclude pattern" in caplog.text
-            caplog.clear()
+            bb_transformed_event, bitbucket_server_event.BitbucketServerWebhookEvent
+        )
+
+        assert not both_patterns.match(event=bb_transformed_event)
+
+    @pytest.mark.parametrize(
+        "source, expect_match, expect_log",
+        [
+            (
+                GithubSource(
+                    type="github", organization="DSO", events=["pull_request.opened"]
+                ),
+                False,
+                "Event source mismatch",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server", project_key="DSO", events=["pr:merged"]
+                ),
+                False,
+                "Event action mismatch",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server", project_key="foo", events=["pr:opened"]
+                ),
+                False,
+                "Project key mismatch",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server", project_key="DSO", events=["pr:opened"]
+                ),
+                True,
+                "No source include patterns defined",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server",
+                    project_key="DSO",
+                    events=["pr:opened"],
+                    include_repositories=["^test-ap{2}$"],
+                ),
+                True,
+                "matched source include pattern",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server",
+                    project_key="DSO",
+                    events=["pr:opened"],
+                    include_repositories=["^test-ap{3}$"],
+                ),
+                False,
+                "did not match source include pattern",
+            ),
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server",
+                    project_key="DSO",
+                    events=["pr:opened"],
+                    include_repositories=["^test-ap{2}$"],
+                    exclude_repositories=["^test.+$"],
+                ),
+                False,
+                "matched source exclude pattern",
+            ),
+        ],
+    )
+    def test_logging(
+        self, bb_transformed_event, caplog, source, expect_match, expect_log
+    ):
+        caplog.set_level(logging.DEBUG, logger="launch_webhook_aws.source")
+        assert source.match(event=bb_transformed_event.event) is expect_match
+        assert expect_log in caplog.text
 
 
 class TestGithubServerSourceMatching:
-    def test_organization_only(self, test_json):
+    def test_organization_only(self, gh_transformed_event):
         good_source = GithubSource(
             type="github", organization="example-org", events=["pull_request.opened"]
         )
@@ -241,22 +304,12 @@ class TestGithubServerSourceMatching:
             type="github", organization="foo", events=["pull_request.opened"]
         )
 
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_server_event.GithubWebhookEvent)
-
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
-
-    def test_include_pattern(self, test_json):
+        assert isinstance(gh_transformed_event, github_server_event.GithubWebhookEvent)
+
+        assert good_source.match(event=gh_transformed_event.event)
+        assert not bad_source.match(event=gh_transformed_event)
+
+    def test_include_pattern(self, gh_transformed_event):
         good_source = GithubSource(
             type="github",
             organization="example-org",
@@ -270,22 +323,12 @@ class TestGithubServerSourceMatching:
             include_repositories=[r"^example-\w{5}$"],
         )
 
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_server_event.GithubWebhookEvent)
-
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
-
-    def test_exclude_pattern(self, test_json):
+        assert isinstance(gh_transformed_event, github_server_event.GithubWebhookEvent)
+
+        assert good_source.match(event=gh_transformed_event.event)
+        assert not bad_source.match(event=gh_transformed_event)
+
+    def test_exclude_pattern(self, gh_transformed_event):
         good_source = GithubSource(
             type="github",
             organization="example-org",
@@ -299,22 +342,12 @@ class TestGithubServerSourceMatching:
             exclude_repositories=[r"^example-\w{4}$"],
         )
 
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_server_event.GithubWebhookEvent)
-
-        assert good_source.match(event=transformed_event.event)
-        assert not bad_source.match(event=transformed_event)
-
-    def test_excluded_and_included_pattern(self, test_json):
+        assert isinstance(gh_transformed_event, github_server_event.GithubWebhookEvent)
+
+        assert good_source.match(event=gh_transformed_event.event)
+        assert not bad_source.match(event=gh_transformed_event)
+
+    def test_excluded_and_included_pattern(self, gh_transformed_event):
         both_patterns = GithubSource(
             type="github",
             organization="example-org",
@@ -322,95 +355,80 @@ class TestGithubServerSourceMatching:
             include_repositories=[r"^example-\w{4}$"],
             exclude_repositories=[r"^example-\w{5}$"],
         )
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-        assert isinstance(transformed_event, github_server_event.GithubWebhookEvent)
-
-        assert both_patterns.match(event=transformed_event.event)
-
-    def test_logging(self, test_json, caplog):
-        event_source_mismatch = BitbucketServerSource(
-            type="bitbucket_server", project_key="DSO", events=["pr:merged"]
-        )
-        event_key_mismatch = GithubSource(
-            type="github", organization="example-org", events=["push"]
-        )
-        organization_mismatch = GithubSource(
-            type="github", organization="foo", events=["pull_request.opened"]
-        )
-        organization_only = GithubSource(
-            type="github", organization="example-org", events=["pull_request.opened"]
-        )
-        include_match = GithubSource(
-            type="github",
-            organization="example-org",
-            events=["pull_request.opened"],
-            include_repositories=[r"^example-\w{4}$"],
-        )
-        include_nomatch = GithubSource(
-            type="github",
-            organization="example-org",
-            events=["pull_request.opened"],
-            include_repositories=[r"^example-\w{5}$"],
-        )
-        exclude_match = GithubSource(
-            type="github",
-            organization="example-org",
-            events=["pull_request.opened"],
-            include_repositories=[r"^example-repo$"],
-            exclude_repositories=[r"^example.+$"],
-        )
 
-        headers = {
-            "X-Github-Hook-Id": "unit-test",
-            "X-Github-Event": "pull_request",
-            "X-Github-Delivery": "unit-test",
-            "X-Hub-Signature": "unit-test",
-            "X-Hub-Signature-256": "unit-test",
-        }
-        body = test_json(pathlib.Path("test/data/events/github/pr_open.json"))
-        source_event = SourceEvent(headers=headers, body=body)
-        transformed_event = source_event.to_source_event()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not event_source_mismatch.match(event=transformed_event.event)
-            assert "Event source mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not event_key_mismatch.match(event=transformed_event.event)
-            assert "Event action mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not organization_mismatch.match(event=transformed_event.event)
-            assert "Organization mismatch" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert organization_only.match(event=transformed_event.event)
-            assert "No source repository include patterns defined" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert include_match.match(event=transformed_event.event)
-            assert "matched source include pattern" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not include_nomatch.match(event=transformed_event.event)
-            assert "did not match source include pattern" in caplog.text
-            caplog.clear()
-
-        with caplog.at_level(logging.DEBUG):
-            assert not exclude_match.match(event=transformed_event.event)
-            assert "matched source exclude pattern" in caplog.text
-            caplog.clear()
+        assert isinstance(gh_transformed_event, github_server_event.GithubWebhookEvent)
+
+        assert both_patterns.match(event=gh_transformed_event.event)
+
+    @pytest.mark.parametrize(
+        "source, expect_match, expect_log",
+        [
+            (
+                BitbucketServerSource(
+                    type="bitbucket_server", project_key="DSO", events=["pr:merged"]
+                ),
+                False,
+                "Event source mismatch",
+            ),
+            (
+                GithubSource(
+                    type="github", organization="example-org", events=["push"]
+                ),
+                False,
+                "Event action mismatch",
+            ),
+            (
+                GithubSource(
+                    type="github", organization="foo", events=["pull_request.opened"]
+                ),
+                False,
+                "Organization mismatch",
+            ),
+            (
+                GithubSource(
+                    type="github",
+                    organization="example-org",
+                    events=["pull_request.opened"],
+                ),
+                True,
+                "No source include patterns defined",
+            ),
+            (
+                GithubSource(
+                    type="github",
+                    organization="example-org",
+                    events=["pull_request.opened"],
+                    include_repositories=[r"^example-\w{4}$"],
+                ),
+                True,
+                "matched source include pattern",
+            ),
+            (
+                GithubSource(
+                    type="github",
+                    organization="example-org",
+                    events=["pull_request.opened"],
+                    include_repositories=[r"^example-\w{5}$"],
+                ),
+                False,
+                "did not match source include pattern",
+            ),
+            (
+                GithubSource(
+                    type="github",
+                    organization="example-org",
+                    events=["pull_request.opened"],
+                    include_repositories=[r"^example-repo$"],
+                    exclude_repositories=[r"^example.+$"],
+                ),
+                False,
+                "matched source exclude pattern",
+            ),
+        ],
+    )
+    def test_logging(
+        self, gh_transformed_event, caplog, source, expect_match, expect_log
+    ):
+        caplog.set_level(logging.DEBUG, logger="launch_webhook_aws.source")
+        assert source.match(event=gh_transformed_event.event) is expect_match
+        assert expect_log in caplog.text
@@ -31,3 +31,7 @@ class TestArnValidation:
     def test_invalid_arns_rejected(self, raw_arn: str):
         with pytest.raises(Exception):
             validate_arn(raw_arn)
+
+    def test_repeated_arns_share_a_parse(self):
+        raw_arn = "arn:aws:iam::123456789012:role/foo"
+        assert validate_arn(raw_arn) is validate_arn(raw_arn)